@@ -5,7 +5,7 @@ from sqlalchemy import select
 from typing import List
 
 from app.core.database import get_async_db
-from app.core.api_helpers import PermissionChecker
+from app.core.api_helpers import PermissionChecker, row_to_schema
 from app.core.constants import ErrorMessages
 from app.schemas.project import (
     Project,
@@ -40,7 +40,7 @@ async def get_projects(
     """
     result = await db.execute(select(ProjectModel).offset(offset).limit(limit))
     projects = result.scalars().all()
-    return projects
+    return [row_to_schema(Project, project) for project in projects]
 
 
 @router.get("/{project_id}", response_model=ProjectWithStations)
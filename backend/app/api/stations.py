@@ -5,7 +5,7 @@ from sqlalchemy import select
 from typing import List
 
 from app.core.database import get_async_db
-from app.core.api_helpers import get_entity_or_404, PermissionChecker
+from app.core.api_helpers import get_entity_or_404, PermissionChecker, row_to_schema
 from app.core.constants import ErrorMessages
 from app.schemas.project import Station, StationCreate, StationUpdate
 from app.models.station import Station as StationModel
@@ -36,7 +36,7 @@ async def get_project_stations(
 
     result = await db.execute(select(StationModel).where(StationModel.project_id == project_id))
     stations = result.scalars().all()
-    return stations
+    return [row_to_schema(Station, station) for station in stations]
 
 
 @router.get("/stations/{station_id}", response_model=Station)
@@ -80,44 +80,41 @@ async def upload_testplan_csv(
         # Read file content
         file_content = await file.read()
 
-        # Parse CSV
-        test_plan_dicts = TestPlanCSVParser.parse_and_convert(file_content)
+        # Parse CSV lazily: rows are validated and converted one at a time
+        # while being streamed into the database
+        test_plan_dicts = TestPlanCSVParser.iter_testplan_dicts(file_content)
 
         # If replace_existing, delete old test plan
+        # Original: committed immediately, before inserting the new items
+        # Modified: delete and inserts share one transaction, so a CSV error
+        # part-way through the file rolls back to the previous test plan
         if replace_existing:
             # Original: db.query(TestPlan).filter(and_(...)).delete()
             await db.execute(sa_delete(TestPlan).where(and_(TestPlan.project_id == project_id, TestPlan.station_id == station_id)))
-            await db.commit()
-
-        # Insert new test plan items
-        created_count = 0
-        errors = []
-
-        for plan_dict in test_plan_dicts:
-            try:
-                # Use TestPlanService to create test plan item
-                test_plan_data = {
-                    **plan_dict,
-                    'project_id': project_id,
-                    'station_id': station_id,
-                    'test_plan_name': test_plan_name
-                }
-                await test_plan_service.create_test_plan(db, test_plan_data)
-                created_count += 1
-            except Exception as e:
-                errors.append(f"Error creating item {plan_dict.get('item_name')}: {str(e)}")
+
+        # Insert new test plan items in flushed batches
+        # Original: test_plan_service.create_test_plan() per item (one query + commit each)
+        total_count, created_count, errors = await test_plan_service.bulk_create_test_plans(
+            db,
+            test_plan_dicts,
+            project_id=project_id,
+            station_id=station_id,
+            test_plan_name=test_plan_name
+        )
+        await db.commit()
 
         return TestPlanUploadResponse(
             message=ResponseMessages.UPLOAD_SUCCESS,
             project_id=project_id,
             station_id=station_id,
-            total_items=len(test_plan_dicts),
+            total_items=total_count,
             created_items=created_count,
-            skipped_items=len(test_plan_dicts) - created_count,
+            skipped_items=total_count - created_count,
             errors=errors if errors else None
         )
 
     except CSVParseError as e:
+        await db.rollback()
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"CSV parsing error: {str(e)}")
     except Exception as e:
         await db.rollback()
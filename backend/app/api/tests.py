@@ -4,13 +4,14 @@ Test Execution API Endpoints
 from datetime import datetime
 from zoneinfo import ZoneInfo
 import logging
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Body, Depends, HTTPException, status
+from fastapi.exceptions import RequestValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, desc, func, exists
 from sqlalchemy import delete as sa_delete
-from pydantic import BaseModel
+from pydantic import BaseModel, ValidationError
 
 _TZ_TAIPEI = ZoneInfo("Asia/Taipei")
 
@@ -460,10 +461,20 @@ async def create_test_result(
         )
 
 
-@router.post("/sessions/{session_id}/results/batch", response_model=dict)
+# The batch body is taken as a plain dict and validated by
+# TestResultBatch.from_payload, so its schema is published explicitly
+_BATCH_BODY_SCHEMA = TestResultBatch.model_json_schema(ref_template="#/components/schemas/{model}")
+_BATCH_BODY_SCHEMA.pop("$defs", None)
+
+
+@router.post(
+    "/sessions/{session_id}/results/batch",
+    response_model=dict,
+    openapi_extra={"requestBody": {"content": {"application/json": {"schema": _BATCH_BODY_SCHEMA}}}},
+)
 async def create_test_results_batch(
     session_id: int,
-    batch_data: TestResultBatch,
+    payload: Dict[str, Any] = Body(...),
     db: AsyncSession = Depends(get_async_db),
     current_user: dict = Depends(get_current_active_user)
 ):
@@ -472,13 +483,21 @@ async def create_test_results_batch(
 
     Args:
         session_id: Test session ID
-        batch_data: Batch of test results
+        payload: Raw TestResultBatch body; results are validated in one pass
         db: Async database session
         current_user: Current authenticated user
 
     Returns:
         Number of results created
     """
+    try:
+        batch_data = TestResultBatch.from_payload(payload)
+    except ValidationError as e:
+        # Same 422 shape as a typed body parameter: locations start at "body"
+        raise RequestValidationError(
+            [{**error, "loc": ("body", *error["loc"])} for error in e.errors()]
+        )
+
     result = await db.execute(
         select(TestSessionModel).where(TestSessionModel.id == session_id)
     )
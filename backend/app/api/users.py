@@ -5,7 +5,7 @@ from sqlalchemy import select, or_
 from typing import List, Optional, Set
 
 from app.core.database import get_async_db
-from app.core.api_helpers import PermissionChecker, get_entity_or_404
+from app.core.api_helpers import PermissionChecker, get_entity_or_404, row_to_schema
 from app.core.constants import ErrorMessages
 from app.schemas.user import UserCreate, UserUpdate, UserInDB, PasswordChange
 from app.models.user import User as UserModel, UserRole
@@ -62,7 +62,7 @@ async def get_users(
 
     result = await db.execute(stmt.offset(offset).limit(limit))
     users = result.scalars().all()
-    return users
+    return [row_to_schema(UserInDB, user) for user in users]
 
 
 @router.get("/{user_id}", response_model=UserInDB)
@@ -73,6 +73,10 @@ class Settings(BaseSettings):
     # 本地環境: ./scripts 或絕對路徑
     SCRIPTS_DIR: str = "./scripts"
 
+    # Seconds a simulated instrument waits in connect() to mimic hardware;
+    # 0 connects immediately so parallel simulated channels are not serialized
+    INSTRUMENT_SIMULATION_DELAY: float = 0.0
+
     # Model config for Pydantic v2
     # 修改: 使用絕對路徑確保無論從哪個目錄啟動都能正確讀取 .env
     model_config = {"env_file": str(ENV_FILE_PATH), "case_sensitive": True, "extra": "ignore"}
@@ -5,17 +5,19 @@ Centralized utilities for common API operations to reduce code duplication.
 Original code patterns repeated across multiple files are consolidated here.
 """
 
-from functools import wraps
-from typing import List, Dict, Any, Optional, TypeVar, Type
+from functools import lru_cache, wraps
+from typing import List, Dict, Any, Optional, Tuple, TypeVar, Type
 # Original code: from sqlalchemy.orm import Session (removed)
 # Modified: Async only now (Wave 6 - Task 14)
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from fastapi import HTTPException, status
+from pydantic import BaseModel
 
 from app.models.test_result import TestResult as TestResultModel
 
 T = TypeVar('T')
+S = TypeVar('S', bound=BaseModel)
 
 
 # =============================================================================
@@ -195,6 +197,38 @@ def calculate_test_statistics(results: List[TestResultModel]) -> Dict[str, int]:
     }
 
 
+# =============================================================================
+# ORM Row -> Response Schema
+# =============================================================================
+
+@lru_cache(maxsize=None)
+def _schema_field_names(schema: Type[BaseModel]) -> Tuple[str, ...]:
+    """Field names of a response schema, computed once per class"""
+    return tuple(schema.model_fields)
+
+
+def row_to_schema(schema: Type[S], row: Any) -> S:
+    """
+    Build a response schema from an ORM row without re-validation
+
+    Uses model_construct() with the schema's field names cached per class, so
+    listing N rows skips the from_attributes validation. Each instance gets
+    its own fields set, since model_copy(update=...) mutates it.
+    Only use this when the ORM column types already match the schema field
+    types (no Decimal -> float or enum coercion needed).
+
+    Args:
+        schema: Response schema class
+        row: ORM instance exposing every schema field as an attribute
+
+    Returns:
+        Schema instance
+    """
+    names = _schema_field_names(schema)
+    values = {name: getattr(row, name) for name in names}
+    return schema.model_construct(_fields_set=set(names), **values)
+
+
 # =============================================================================
 # Response Builders
 # =============================================================================
@@ -80,6 +80,14 @@ async def startup_event():
     logger.info(f"Starting {settings.APP_NAME} v{settings.APP_VERSION}")
     logger.info(f"Debug mode: {settings.DEBUG}")
 
+    # uvicorn's default --loop auto picks uvloop when it is installed (it ships
+    # with uvicorn[standard]); report which loop serial/DUT I/O is running on
+    loop_type = type(asyncio.get_running_loop())
+    if loop_type.__module__.startswith("uvloop"):
+        logger.info("Event loop: uvloop")
+    else:
+        logger.info(f"Event loop: {loop_type.__module__}.{loop_type.__name__} (uvloop not in use)")
+
     # 新增: 初始化全域 DB-backed InstrumentConfigProvider
     # 讓 ConSoleMeasurement / ComPortMeasurement / TCPIPMeasurement 能讀 instruments 表
     # Original code: from app.core.database import SessionLocal as SyncSessionLocal
@@ -115,6 +123,15 @@ async def shutdown_event():
     """Shutdown event handler"""
     logger.info(f"Shutting down {settings.APP_NAME}")
 
+    # Release the pooled chassis fixture and relay serial ports
+    from app.services.dut_comms import close_chassis_controller, close_relay_controller
+    await close_chassis_controller()
+    await close_relay_controller()
+
+    # Release the pooled LS safety interface serial ports
+    from app.services.dut_comms.ls_comms import close_safety_interfaces
+    await close_safety_interfaces()
+
     # ✅ Added: Cleanup logging resources
     await logging_manager.cleanup()
 
@@ -0,0 +1,17 @@
+"""Shared result enums for test result and test session schemas"""
+from enum import Enum
+
+
+class ItemResultEnum(str, Enum):
+    """Individual test item result"""
+    PASS = "PASS"
+    FAIL = "FAIL"
+    SKIP = "SKIP"
+    ERROR = "ERROR"
+
+
+class TestResultEnum(str, Enum):
+    """Test session result"""
+    PASS = "PASS"
+    FAIL = "FAIL"
+    ABORT = "ABORT"
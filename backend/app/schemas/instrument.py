@@ -41,4 +41,4 @@ class InstrumentResponse(InstrumentBase):
     created_at: datetime
     updated_at: datetime
 
-    model_config = {"from_attributes": True}
+    model_config = {"from_attributes": True, "frozen": True}
@@ -89,7 +89,7 @@ class ModbusConfigResponse(ModbusConfigBase):
     id: int
     station_id: int
 
-    model_config = {"from_attributes": True}
+    model_config = {"from_attributes": True, "frozen": True}
 
 
 class ModbusStatusResponse(BaseModel):
@@ -1,5 +1,5 @@
 """Project and Station schemas"""
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, List
 from datetime import datetime
 
@@ -33,8 +33,7 @@ class ProjectInDB(ProjectBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(frozen=True, from_attributes=True)
 
 
 class Project(ProjectInDB):
@@ -72,8 +71,7 @@ class StationInDB(StationBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(frozen=True, from_attributes=True)
 
 
 class Station(StationInDB):
@@ -85,5 +83,4 @@ class ProjectWithStations(Project):
     """Project with stations included"""
     stations: List[Station] = []
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(frozen=True, from_attributes=True)
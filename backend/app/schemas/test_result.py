@@ -1,17 +1,10 @@
 """Test Result schemas"""
-from pydantic import BaseModel, Field
-from typing import Optional, Union
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+from typing import Any, Dict, Optional, Union
+from typing_extensions import TypedDict
 from datetime import datetime
 from decimal import Decimal
-from enum import Enum
-
-
-class ItemResultEnum(str, Enum):
-    """Individual test item result"""
-    PASS = "PASS"
-    FAIL = "FAIL"
-    SKIP = "SKIP"
-    ERROR = "ERROR"
+from app.schemas._enums import ItemResultEnum
 
 
 class TestResultCreate(BaseModel):
@@ -21,8 +14,9 @@ class TestResultCreate(BaseModel):
     item_no: int
     item_name: str
     measured_value: Optional[Union[Decimal, str]] = None
-    lower_limit: Optional[Decimal] = None
-    upper_limit: Optional[Decimal] = None
+    # float (not Decimal) to match TestPlanBase; DB column stays DECIMAL(15, 6)
+    lower_limit: Optional[float] = None
+    upper_limit: Optional[float] = None
     unit: Optional[str] = None
     result: ItemResultEnum
     error_message: Optional[str] = None
@@ -36,11 +30,35 @@ class TestResult(TestResultCreate):
     id: int
     test_time: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(frozen=True, from_attributes=True)
 
 
 class TestResultBatch(BaseModel):
     """Batch upload test results"""
     session_id: int
     results: list[TestResultCreate]
+
+    @classmethod
+    def from_payload(cls, payload: Dict[str, Any]) -> "TestResultBatch":
+        """
+        Validate a raw batch payload
+
+        The whole payload is validated in a single call on a shared
+        TypeAdapter, then the batch is assembled without re-validation.
+        Error locations match model validation (e.g. ``("results", 0, "result")``).
+
+        Raises:
+            pydantic.ValidationError: If session_id or any result is invalid
+        """
+        data = TEST_RESULT_BATCH_ADAPTER.validate_python(payload)
+        return cls.model_construct(session_id=data["session_id"], results=data["results"])
+
+
+class _TestResultBatchPayload(TypedDict):
+    """TestResultBatch fields, validated as a plain dict"""
+    session_id: int
+    results: list[TestResultCreate]
+
+
+# Module-level adapter, built once and reused by every batch upload
+TEST_RESULT_BATCH_ADAPTER = TypeAdapter(_TestResultBatchPayload)
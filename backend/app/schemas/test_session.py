@@ -1,15 +1,11 @@
 """Test Session schemas"""
-from pydantic import BaseModel, Field
-from typing import Optional
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Literal, Optional
 from datetime import datetime
-from enum import Enum
+from app.schemas._enums import TestResultEnum
 
-
-class TestResultEnum(str, Enum):
-    """Test session result"""
-    PASS = "PASS"
-    FAIL = "FAIL"
-    ABORT = "ABORT"
+# Allowed session execution states (mirrors get_test_session_status)
+SessionStatus = Literal["RUNNING", "PAUSED", "COMPLETED", "ABORTED"]
 
 
 class TestSessionCreate(BaseModel):
@@ -21,15 +17,14 @@ class TestSessionCreate(BaseModel):
 class TestSessionStatus(BaseModel):
     """Test session status update"""
     session_id: int
-    status: str
+    status: SessionStatus
     current_item: Optional[int] = None
     total_items: Optional[int] = None
     pass_items: Optional[int] = None
     fail_items: Optional[int] = None
     elapsed_time_seconds: Optional[float] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(frozen=True, from_attributes=True)
 
 
 class TestSessionComplete(BaseModel):
@@ -57,8 +52,7 @@ class TestSession(BaseModel):
     created_at: datetime
     test_plan_name: Optional[str] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(frozen=True, from_attributes=True)
 
 
 class TestSessionDetail(TestSession):
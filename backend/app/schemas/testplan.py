@@ -1,12 +1,22 @@
 """Test Plan schemas"""
 from typing import Optional, Dict, Any
 from datetime import datetime
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+
+
+# Shared field descriptors, built once at import and reused across the models
+# below instead of constructing an identical FieldInfo for every attribute.
+_OPTIONAL_FIELD = Field(default=None)
+_CSV_COLUMN_FIELD = Field(default="")
 
 
 # ============================================================================
 # Test Plan Schemas
 # ============================================================================
+# Note: these stay BaseModel rather than pydantic dataclasses.
+# TestPlanCreate subclasses TestPlanBase (a BaseModel cannot inherit from a
+# dataclass) and the update endpoint relies on
+# TestPlanUpdate.dict(exclude_unset=True), which dataclasses do not track.
 class TestPlanBase(BaseModel):
     """Base test plan schema"""
     # Core fields
@@ -23,18 +33,18 @@ class TestPlanBase(BaseModel):
     test_plan_name: Optional[str] = Field(default=None, description="Test plan name")
 
     # CSV import fields
-    item_key: Optional[str] = Field(default=None)
-    value_type: Optional[str] = Field(default=None)
-    limit_type: Optional[str] = Field(default=None)
-    eq_limit: Optional[str] = Field(default=None)
-    pass_or_fail: Optional[str] = Field(default=None)
-    measure_value: Optional[str] = Field(default=None)
-    execute_name: Optional[str] = Field(default=None)
-    case_type: Optional[str] = Field(default=None)
-    command: Optional[str] = Field(default=None)
-    timeout: Optional[int] = Field(default=None)
-    use_result: Optional[str] = Field(default=None)
-    wait_msec: Optional[int] = Field(default=None)
+    item_key: Optional[str] = _OPTIONAL_FIELD
+    value_type: Optional[str] = _OPTIONAL_FIELD
+    limit_type: Optional[str] = _OPTIONAL_FIELD
+    eq_limit: Optional[str] = _OPTIONAL_FIELD
+    pass_or_fail: Optional[str] = _OPTIONAL_FIELD
+    measure_value: Optional[str] = _OPTIONAL_FIELD
+    execute_name: Optional[str] = _OPTIONAL_FIELD
+    case_type: Optional[str] = _OPTIONAL_FIELD
+    command: Optional[str] = _OPTIONAL_FIELD
+    timeout: Optional[int] = _OPTIONAL_FIELD
+    use_result: Optional[str] = _OPTIONAL_FIELD
+    wait_msec: Optional[int] = _OPTIONAL_FIELD
 
 
 class TestPlanCreate(TestPlanBase):
@@ -77,8 +87,7 @@ class TestPlan(TestPlanBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(frozen=True, from_attributes=True)
 
 
 # ============================================================================
@@ -86,36 +95,40 @@ class TestPlan(TestPlanBase):
 # ============================================================================
 class TestPlanCSVRow(BaseModel):
     """Single CSV row for test plan import"""
-    ID: str = Field(..., alias="ID")
-    ItemKey: str = Field(default="", alias="ItemKey")
-    ValueType: str = Field(default="string", alias="ValueType")
-    LimitType: str = Field(default="none", alias="LimitType")
-    EqLimit: str = Field(default="", alias="EqLimit")
-    LL: str = Field(default="", alias="LL")
-    UL: str = Field(default="", alias="UL")
-    PassOrFail: str = Field(default="", alias="PassOrFail")
-    measureValue: str = Field(default="", alias="measureValue")
-    ExecuteName: str = Field(default="", alias="ExecuteName")
-    case: str = Field(default="", alias="case")
-    Port: str = Field(default="", alias="Port")
-    Baud: str = Field(default="", alias="Baud")
-    Command: str = Field(default="", alias="Command")
-    InitialCommand: str = Field(default="", alias="InitialCommand")
-    Timeout: str = Field(default="", alias="Timeout")
-    UseResult: str = Field(default="", alias="UseResult")
-    WaitmSec: str = Field(default="", alias="WaitmSec")
-    Instrument: str = Field(default="", alias="Instrument")
-    Channel: str = Field(default="", alias="Channel")
-    Item: str = Field(default="", alias="Item")
-    Type: str = Field(default="", alias="Type")
-    ImagePath: str = Field(default="", alias="ImagePath")
-    content: str = Field(default="", alias="content")
-    keyWord: str = Field(default="", alias="keyWord")
-    spiltCount: str = Field(default="", alias="spiltCount")
-    splitLength: str = Field(default="", alias="splitLength")
-
-    class Config:
-        populate_by_name = True
+    ID: str
+    ItemKey: str = _CSV_COLUMN_FIELD
+    ValueType: str = "string"
+    LimitType: str = "none"
+    EqLimit: str = _CSV_COLUMN_FIELD
+    LL: str = _CSV_COLUMN_FIELD
+    UL: str = _CSV_COLUMN_FIELD
+    PassOrFail: str = _CSV_COLUMN_FIELD
+    measureValue: str = _CSV_COLUMN_FIELD
+    ExecuteName: str = _CSV_COLUMN_FIELD
+    case: str = _CSV_COLUMN_FIELD
+    Port: str = _CSV_COLUMN_FIELD
+    Baud: str = _CSV_COLUMN_FIELD
+    Command: str = _CSV_COLUMN_FIELD
+    InitialCommand: str = _CSV_COLUMN_FIELD
+    Timeout: str = _CSV_COLUMN_FIELD
+    UseResult: str = _CSV_COLUMN_FIELD
+    WaitmSec: str = _CSV_COLUMN_FIELD
+    Instrument: str = _CSV_COLUMN_FIELD
+    Channel: str = _CSV_COLUMN_FIELD
+    Item: str = _CSV_COLUMN_FIELD
+    Type: str = _CSV_COLUMN_FIELD
+    ImagePath: str = _CSV_COLUMN_FIELD
+    content: str = _CSV_COLUMN_FIELD
+    keyWord: str = _CSV_COLUMN_FIELD
+    spiltCount: str = _CSV_COLUMN_FIELD
+    splitLength: str = _CSV_COLUMN_FIELD
+
+    model_config = ConfigDict(populate_by_name=True)
+
+
+# Built once at import and shared by every CSV upload, so the parse loop calls
+# validate_python() directly instead of going through the model constructor.
+CSV_ROW_ADAPTER = TypeAdapter(TestPlanCSVRow)
 
 
 # ============================================================================
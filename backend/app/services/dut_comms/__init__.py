@@ -5,19 +5,23 @@ Handles device-under-test communications including relay control and chassis rot
 from app.services.dut_comms.relay_controller import (
     RelayController,
     RelayState,
-    get_relay_controller
+    get_relay_controller,
+    close_relay_controller
 )
 from app.services.dut_comms.chassis_controller import (
     ChassisController,
     RotationDirection,
-    get_chassis_controller
+    get_chassis_controller,
+    close_chassis_controller
 )
 
 __all__ = [
     "RelayController",
     "RelayState",
     "get_relay_controller",
+    "close_relay_controller",
     "ChassisController",
     "RotationDirection",
     "get_chassis_controller",
+    "close_chassis_controller",
 ]
@@ -4,9 +4,21 @@ Manages chassis fixture rotation for DUT testing
 """
 import asyncio
 import logging
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Awaitable, Callable, Tuple
 from enum import IntEnum
 
+try:
+    from asyncio import timeout as async_timeout  # Python 3.11+
+except ImportError:  # Python < 3.11: backport declared in pyproject.toml
+    from async_timeout import timeout as async_timeout
+
+from .ltl_chassis_fixt_comms.chassis_transport import ChassisTransport
+from .ltl_chassis_fixt_comms.chassis_msgs import (
+    RotateTurntable,
+    operation_enum,
+    status_enum
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -16,6 +28,16 @@ class RotationDirection(IntEnum):
     COUNTERCLOCKWISE = 9  # CCW command code
 
 
+# PDTool4 protocol: operation 1 = CCW (left), operation 2 = CW (right)
+_DIRECTION_MAP = {
+    RotationDirection.CLOCKWISE: operation_enum.ROTATE_RIGHT.value,
+    RotationDirection.COUNTERCLOCKWISE: operation_enum.ROTATE_LEFT.value,
+}
+_DIRECTION_NAMES = {direction: direction.name for direction in RotationDirection}
+DEFAULT_ROTATION_ANGLE = 90  # Degrees
+DEFAULT_CHASSIS_DEVICE = "/dev/ttyACM0"
+
+
 class ChassisController:
     """
     Controls chassis fixture rotation for DUT positioning.
@@ -30,11 +52,39 @@ class ChassisController:
             device_path: Serial port path (e.g., '/dev/ttyACM0')
             config: Additional configuration parameters
         """
-        self.device_path = device_path or "/dev/ttyACM0"
+        self.device_path = device_path or DEFAULT_CHASSIS_DEVICE
         self.config = config or {}
         self.logger = logging.getLogger(self.__class__.__name__)
         self._is_rotating = False
-        self._control_script = self.config.get("control_script", "./chassis_comms/chassis_fixture_bat.py")
+        # Serial transport is opened on first use and kept open between rotations
+        self._transport: Optional[ChassisTransport] = None
+        self._transport_lock = asyncio.Lock()
+
+    async def _ensure_transport(self) -> ChassisTransport:
+        """
+        Return the pooled transport, opening the serial port if needed.
+
+        Must be called with _transport_lock held.
+        """
+        if self._transport is None or self._transport.writer is None:
+            transport = ChassisTransport(self.device_path)
+            await transport.connect()
+            self._transport = transport
+        return self._transport
+
+    async def _drop_transport(self) -> None:
+        """Close and forget the pooled transport. Caller holds _transport_lock."""
+        transport, self._transport = self._transport, None
+        if transport is not None:
+            try:
+                await transport.close()
+            except Exception as e:
+                self.logger.warning("Error closing chassis transport: %s", e)
+
+    async def close(self) -> None:
+        """Close the pooled serial connection, if open."""
+        async with self._transport_lock:
+            await self._drop_transport()
 
     async def rotate(
         self,
@@ -56,37 +106,26 @@ class ChassisController:
                 self.logger.warning("Chassis is already rotating")
                 return False
 
-            direction_name = "CLOCKWISE" if direction == RotationDirection.CLOCKWISE else "COUNTERCLOCKWISE"
-            self.logger.info(f"Starting chassis rotation: {direction_name} (code={direction})")
+            direction_name = _DIRECTION_NAMES.get(direction, str(direction))
+            self.logger.info("Starting chassis rotation: %s (code=%s)", direction_name, direction)
 
             self._is_rotating = True
 
-            # TODO: OLD IMPLEMENTATION (Script-based):
-            # Build command arguments
-            # Format: python chassis_fixture_bat.py <device> <direction_code> <command_type>
-            # cmd_args = [
-            #     "python3",
-            #     self._control_script,
-            #     self.device_path,
-            #     str(direction),
-            #     "1"  # Command type: 1 = rotation command
-            # ]
-            #
-            # # Execute chassis control script asynchronously
-            # process = await asyncio.create_subprocess_exec(...)
-            #
-            # NEW IMPLEMENTATION: Direct serial communication
+            # Direct serial communication via ChassisTransport
             success = await self._send_rotation_command(direction, duration_ms)
 
             if not success:
-                self.logger.error(f"Failed to execute chassis rotation: {direction_name}")
+                self.logger.error("Failed to execute chassis rotation: %s", direction_name)
                 return False
 
-            self.logger.info(f"Chassis rotation {direction_name} completed successfully")
+            self.logger.info("Chassis rotation %s completed successfully", direction_name)
             return True
 
         except Exception as e:
-            self.logger.error(f"Chassis rotation error: {e}", exc_info=True)
+            self.logger.error(
+                "Chassis rotation error: %s", e,
+                exc_info=self.logger.isEnabledFor(logging.DEBUG)
+            )
             return False
         finally:
             self._is_rotating = False
@@ -103,57 +142,62 @@ class ChassisController:
             True if command executed successfully
         """
         try:
-            from .ltl_chassis_fixt_comms.chassis_transport import ChassisTransport
-            from .ltl_chassis_fixt_comms.chassis_msgs import (
-                RotateTurntable,
-                operation_enum,
-                status_enum
-            )
-
             # Map direction to operation
-            # PDTool4 protocol: operation 1 = CCW (left), operation 2 = CW (right)
-            if direction == RotationDirection.CLOCKWISE:
-                operation = operation_enum.ROTATE_RIGHT.value  # 2
-                angle = 90  # Default rotation angle in degrees
-            else:  # COUNTERCLOCKWISE
-                operation = operation_enum.ROTATE_LEFT.value  # 1
-                angle = 90  # Default rotation angle in degrees
+            operation = _DIRECTION_MAP[direction]
+            angle = DEFAULT_ROTATION_ANGLE
 
             # If duration_ms provided, calculate angle (assuming ~1 deg/ms speed)
             # This is a rough estimate - actual speed depends on hardware
             if duration_ms:
                 angle = min(int(duration_ms / 10), 360)  # Cap at 360 degrees
 
-            self.logger.debug(f"Sending rotation command: operation={operation}, angle={angle}")
-
-            # Open connection and send command
-            async with ChassisTransport(self.device_path) as transport:
-                # Create rotation message
-                msg = RotateTurntable()
-                msg.operation = operation
-                msg.angle = angle
-
-                # Send command
-                await transport.send_msg(msg)
-
-                # Wait for response
-                header, response, footer = await transport.get_msg()
-
-                # Check status
-                if hasattr(response, 'status'):
-                    if response.status == status_enum.SUCCESS.value:
-                        self.logger.info(f"Chassis rotation command successful")
-                        return True
-                    else:
-                        self.logger.error(f"Chassis rotation failed with status: {response.status}")
-                        return False
+            self.logger.debug("Sending rotation command: operation=%s, angle=%s", operation, angle)
+
+            # Bound the whole exchange so a silent fixture cannot hang the caller
+            exchange_timeout = max((duration_ms or 10000) / 1000.0, 2.0)
+
+            # Reuse the pooled connection; the lock keeps request/response pairs atomic
+            async with self._transport_lock:
+                try:
+                    transport = await self._ensure_transport()
+
+                    # Create rotation message
+                    msg = RotateTurntable()
+                    msg.operation = operation
+                    msg.angle = angle
+
+                    async with async_timeout(exchange_timeout):
+                        # Send command
+                        await transport.send_msg(msg)
+
+                        # Wait for response
+                        header, response, footer = await transport.get_msg()
+                except Exception:
+                    # Port state is unknown after a failed exchange; reopen next time
+                    await self._drop_transport()
+                    raise
+
+            # Check status
+            if hasattr(response, 'status'):
+                if response.status == status_enum.SUCCESS.value:
+                    self.logger.info("Chassis rotation command successful")
+                    return True
                 else:
-                    # Unexpected response type
-                    self.logger.warning(f"Unexpected response type: {type(response)}")
+                    self.logger.error("Chassis rotation failed with status: %s", response.status)
                     return False
+            else:
+                # Unexpected response type
+                self.logger.warning("Unexpected response type: %s", type(response))
+                return False
 
+        except asyncio.TimeoutError:
+            self.logger.error("Chassis rotation command timed out after %ss", exchange_timeout)
+            return False
         except Exception as e:
-            self.logger.error(f"Failed to send rotation command: {e}", exc_info=True)
+            self.logger.error(
+                "Failed to send rotation command: %s", e,
+                exc_info=self.logger.isEnabledFor(logging.DEBUG)
+            )
             return False
 
     async def rotate_clockwise(self, duration_ms: Optional[int] = None) -> bool:
@@ -182,6 +226,33 @@ class ChassisController:
         """
         return await self.rotate(RotationDirection.COUNTERCLOCKWISE, duration_ms)
 
+    async def rotate_and_measure(
+        self,
+        direction: RotationDirection,
+        read_fn: Callable[[], Awaitable[Any]],
+        duration_ms: Optional[int] = None
+    ) -> Tuple[bool, Any]:
+        """
+        Rotate chassis while concurrently running a measurement.
+
+        The rotation and read_fn (e.g. an encoder or sensor read on a separate
+        port) are awaited together, so the reading is ready when the rotation
+        completes instead of being started afterwards.
+
+        Args:
+            direction: RotationDirection.CLOCKWISE or COUNTERCLOCKWISE
+            read_fn: Coroutine function performing the measurement
+            duration_ms: Optional rotation duration
+
+        Returns:
+            Tuple of (rotation success, measurement result)
+        """
+        rotated, measurement = await asyncio.gather(
+            self.rotate(direction, duration_ms),
+            read_fn()
+        )
+        return rotated, measurement
+
     async def stop_rotation(self) -> bool:
         """
         Stop chassis rotation.
@@ -204,8 +275,8 @@ class ChassisController:
         return self._is_rotating
 
 
-# Global chassis controller instance
-_chassis_controller_instance: Optional[ChassisController] = None
+# Shared controllers by device path (each owns its serial port); closed on shutdown
+_chassis_controllers: Dict[str, ChassisController] = {}
 
 
 def get_chassis_controller(
@@ -213,7 +284,11 @@ def get_chassis_controller(
     config: Optional[Dict[str, Any]] = None
 ) -> ChassisController:
     """
-    Get or create global chassis controller instance.
+    Get or create the shared chassis controller for a device.
+
+    There is one controller per device path, so its lock and pooled serial
+    connection are shared by every caller. config only applies when the
+    controller for that device is first created.
 
     Args:
         device_path: Device path for chassis control
@@ -222,9 +297,15 @@ def get_chassis_controller(
     Returns:
         ChassisController instance
     """
-    global _chassis_controller_instance
-
-    if _chassis_controller_instance is None:
-        _chassis_controller_instance = ChassisController(device_path, config)
-
-    return _chassis_controller_instance
+    device_path = device_path or DEFAULT_CHASSIS_DEVICE
+    controller = _chassis_controllers.get(device_path)
+    if controller is None:
+        controller = ChassisController(device_path, config)
+        _chassis_controllers[device_path] = controller
+    return controller
+
+
+async def close_chassis_controller() -> None:
+    """Close the shared chassis controllers' serial connections on shutdown."""
+    for controller in _chassis_controllers.values():
+        await controller.close()
@@ -8,30 +8,93 @@ Refactored from PDTool4 polish/dut_comms modules.
 """
 import struct
 import ctypes
+import keyword
+from types import MappingProxyType
 from typing import Any, List
-from collections import OrderedDict
 
+__all__ = ["StructMessage", "build_msg_packing_format", "get_values"]
 
-class StructMessage:
+
+# Byte values longer than this are shown as "<N bytes>" in __repr__
+_REPR_MAX_BYTES = 16
+
+# ctypes -> struct format character, shared by build_msg_packing_format (read-only)
+_CTYPES_TO_STRUCT = MappingProxyType({
+    ctypes.c_uint8: 'B',
+    ctypes.c_int8: 'b',
+    ctypes.c_uint16: 'H',
+    ctypes.c_int16: 'h',
+    ctypes.c_uint32: 'I',
+    ctypes.c_int32: 'i',
+    ctypes.c_uint64: 'Q',
+    ctypes.c_int64: 'q',
+    ctypes.c_float: 'f',
+    ctypes.c_double: 'd',
+})
+
+
+class _StructMessageMeta(type):
+    """
+    Metaclass that turns each subclass's ``fields`` into ``__slots__``.
+
+    Slots have to exist when the class object is created, which is too late
+    for ``__init_subclass__``, so they are injected into the namespace here.
+    """
+
+    def __new__(mcls, name, bases, namespace, **kwargs):
+        if "__slots__" not in namespace:
+            inherited = {
+                slot
+                for base in bases
+                for klass in base.__mro__
+                for slot in getattr(klass, "__slots__", ())
+            }
+            namespace["__slots__"] = tuple(
+                field for field in namespace.get("fields", ()) if field not in inherited
+            )
+        return super().__new__(mcls, name, bases, namespace, **kwargs)
+
+
+class StructMessage(metaclass=_StructMessageMeta):
     """
     Base class for binary message serialization and deserialization.
 
     Subclasses must define:
-    - fields: OrderedDict mapping field names to ctypes types
-    - pack_str: struct.pack format string
+    - fields: dict mapping field names to ctypes types
+    - pack_str: struct.pack format string (optional; derived from fields
+      with build_msg_packing_format when left empty)
+
+    Field values are stored in ``__slots__`` generated from ``fields``, so
+    instances have no per-instance ``__dict__``.
 
     Example:
         class MyMessage(StructMessage):
-            fields = OrderedDict([
-                ("command", ctypes.c_uint8),
-                ("param1", ctypes.c_uint16),
-            ])
+            fields = {
+                "command": ctypes.c_uint8,
+                "param1": ctypes.c_uint16,
+            }
             pack_str = "<BH"
     """
 
-    fields: OrderedDict = OrderedDict()
+    fields: dict = {}
     pack_str: str = ""
 
+    # Compiled once per subclass in __init_subclass__
+    _struct: struct.Struct = None
+    _size: int = 0
+    _field_names: tuple = ()
+
+    def __init_subclass__(cls, **kwargs):
+        """Pre-compile the subclass pack_str so it is not re-parsed per call."""
+        super().__init_subclass__(**kwargs)
+        if not cls.pack_str and cls.fields:
+            cls.pack_str = build_msg_packing_format(cls)
+        if cls.pack_str:
+            cls._struct = struct.Struct(cls.pack_str)
+            cls._size = cls._struct.size
+            cls._field_names = tuple(cls.fields)
+            _specialize(cls)
+
     def __init__(self):
         """Initialize all fields to None."""
         for name in self.fields:
@@ -39,11 +102,11 @@ class StructMessage:
 
     def get_msg_size(self) -> int:
         """Calculate the total message size in bytes."""
-        return struct.calcsize(self.pack_str)
+        return self._size
 
     def get_values(self) -> List[Any]:
         """Get current field values as a list."""
-        return [getattr(self, name) for name in self.fields]
+        return [getattr(self, name) for name in self._field_names]
 
     def serialize(self) -> bytes:
         """
@@ -53,10 +116,56 @@ class StructMessage:
             bytes: Serialized message binary data
         """
         try:
-            return struct.pack(self.pack_str, *self.get_values())
+            return self._struct.pack(*[getattr(self, name) for name in self._field_names])
         except struct.error as e:
             raise ValueError(f"Failed to serialize {self.__class__.__name__}: {e}")
 
+    def pack_into(self, buffer: bytearray, offset: int = 0) -> int:
+        """
+        Serialize the message directly into a writable buffer.
+
+        Args:
+            buffer: Pre-allocated writable buffer (e.g. bytearray)
+            offset: Byte offset to start writing at
+
+        Returns:
+            int: Offset just past the packed message
+
+        Raises:
+            ValueError: If packing fails
+        """
+        try:
+            self._struct.pack_into(buffer, offset, *[getattr(self, name) for name in self._field_names])
+        except struct.error as e:
+            raise ValueError(f"Failed to serialize {self.__class__.__name__}: {e}")
+        return offset + self._size
+
+    @classmethod
+    def serialize_many(cls, msgs: List["StructMessage"]) -> bytes:
+        """
+        Serialize several messages of this type into one contiguous buffer.
+
+        Lets a transport send a burst of messages with a single write().
+
+        Args:
+            msgs: Instances of this message class
+
+        Returns:
+            bytes: Concatenated serialized messages
+
+        Raises:
+            ValueError: If packing any message fails
+        """
+        size = cls._size
+        packer = cls._struct
+        buffer = bytearray(size * len(msgs))
+        try:
+            for i, msg in enumerate(msgs):
+                packer.pack_into(buffer, i * size, *[getattr(msg, name) for name in cls._field_names])
+        except struct.error as e:
+            raise ValueError(f"Failed to serialize {cls.__name__}: {e}")
+        return bytes(buffer)
+
     def deserialize(self, msg_blob: bytes) -> None:
         """
         Deserialize bytes into this message object.
@@ -68,21 +177,98 @@ class StructMessage:
             ValueError: If deserialization fails
         """
         try:
-            values = struct.unpack(self.pack_str, msg_blob)
-            for name, value in zip(self.fields, values):
+            values = self._struct.unpack(msg_blob)
+            for name, value in zip(self._field_names, values):
                 setattr(self, name, value)
         except struct.error as e:
             raise ValueError(f"Failed to deserialize {self.__class__.__name__}: {e}")
 
+    def deserialize_from(self, buffer: bytes, offset: int = 0) -> int:
+        """
+        Deserialize this message from a larger buffer without slicing it.
+
+        Accepts anything supporting the buffer protocol (bytes, bytearray,
+        memoryview), so a receive buffer holding several back-to-back frames
+        can be walked by advancing the returned offset.
+
+        Args:
+            buffer: Buffer containing the message
+            offset: Byte offset the message starts at
+
+        Returns:
+            int: Offset just past the deserialized message
+
+        Raises:
+            ValueError: If the buffer is too short
+        """
+        try:
+            values = self._struct.unpack_from(buffer, offset)
+        except struct.error as e:
+            raise ValueError(f"Failed to deserialize {self.__class__.__name__}: {e}")
+        for name, value in zip(self._field_names, values):
+            setattr(self, name, value)
+        return offset + self._size
+
     def __repr__(self) -> str:
-        """String representation showing field values."""
+        """String representation showing field values (long byte arrays summarized)."""
         field_strs = []
-        for name in self.fields:
-            value = getattr(self, name)
-            field_strs.append(f"{name}={value}")
+        for name in self._field_names:
+            value = getattr(self, name, None)
+            if isinstance(value, (bytes, bytearray)) and len(value) > _REPR_MAX_BYTES:
+                field_strs.append(f"{name}=<{len(value)} bytes>")
+            else:
+                field_strs.append(f"{name}={value}")
         return f"{self.__class__.__name__}({', '.join(field_strs)})"
 
 
+_SPECIALIZED_TEMPLATE = """
+def serialize(self):
+    try:
+        return _pack({getters})
+    except _error as e:
+        raise ValueError(f"Failed to serialize {{type(self).__name__}}: {{e}}")
+
+def deserialize(self, msg_blob):
+    try:
+        {setters} = _unpack(msg_blob)
+    except _error as e:
+        raise ValueError(f"Failed to deserialize {{type(self).__name__}}: {{e}}")
+"""
+
+
+def _specialize(cls: type) -> None:
+    """
+    Generate serialize/deserialize with the field accesses written out.
+
+    Replaces the generic per-field loops with straight-line code such as
+    ``return _pack(self.sync, self.length, ...)``. Classes that override
+    either method themselves, or whose fields do not map one-to-one onto
+    struct values (e.g. array fields), keep the generic implementation.
+    """
+    names = cls._field_names
+    if not names or not all(name.isidentifier() and not keyword.iskeyword(name) for name in names):
+        return
+    if len(cls._struct.unpack(bytes(cls._size))) != len(names):
+        return
+    for method in ("serialize", "deserialize"):
+        current = getattr(cls, method)
+        if current is not getattr(StructMessage, method) and not getattr(current, "_specialized", False):
+            return
+
+    source = _SPECIALIZED_TEMPLATE.format(
+        getters=", ".join(f"self.{name}" for name in names),
+        setters=", ".join(f"self.{name}" for name in names) + ",",
+    )
+    namespace = {"_pack": cls._struct.pack, "_unpack": cls._struct.unpack, "_error": struct.error}
+    exec(source, namespace)
+    for method in ("serialize", "deserialize"):
+        func = namespace[method]
+        func.__qualname__ = f"{cls.__qualname__}.{method}"
+        func.__doc__ = getattr(StructMessage, method).__doc__
+        func._specialized = True
+        setattr(cls, method, func)
+
+
 def build_msg_packing_format(msg_class: type) -> str:
     """
     Build struct packing format string from a StructMessage class.
@@ -96,27 +282,13 @@ def build_msg_packing_format(msg_class: type) -> str:
     format_parts = ["<"]  # Little-endian by default
 
     for field_name, field_type in msg_class.fields.items():
-        # Map ctypes to struct format characters
-        type_map = {
-            ctypes.c_uint8: 'B',
-            ctypes.c_int8: 'b',
-            ctypes.c_uint16: 'H',
-            ctypes.c_int16: 'h',
-            ctypes.c_uint32: 'I',
-            ctypes.c_int32: 'i',
-            ctypes.c_uint64: 'Q',
-            ctypes.c_int64: 'q',
-            ctypes.c_float: 'f',
-            ctypes.c_double: 'd',
-        }
-
-        if field_type in type_map:
-            format_parts.append(type_map[field_type])
+        if field_type in _CTYPES_TO_STRUCT:
+            format_parts.append(_CTYPES_TO_STRUCT[field_type])
         elif hasattr(field_type, '_length_'):
             # Array type
             base_type = field_type._type_
             length = field_type._length_
-            format_parts.append(type_map.get(base_type, 'B') * length)
+            format_parts.append(_CTYPES_TO_STRUCT.get(base_type, 'B') * length)
         else:
             # Default to unsigned int
             format_parts.append('I')
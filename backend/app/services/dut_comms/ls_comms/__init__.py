@@ -12,6 +12,8 @@ Key features:
 """
 from .ls_msgs import (
     StructMessage,
+    HDR,
+    BODY,
     MsgHeader,
     CliffMsgBody_t,
     EncoderMsgBody_t,
@@ -20,26 +22,34 @@ from .ls_msgs import (
     command_msg_map,
 )
 from .ls_mod import (
+    LSProtocol,
     SafetyInterface,
     SafetyInterfaceError,
     SafetyInterfaceConnectionError,
     SafetyInterfaceTimeout,
     read_cliff_sensor,
     read_encoder,
+    read_all_cliff_sensors,
+    close_safety_interfaces,
 )
 
 __all__ = [
     'StructMessage',
+    'HDR',
+    'BODY',
     'MsgHeader',
     'CliffMsgBody_t',
     'EncoderMsgBody_t',
     'CLIFF_MSG',
     'ENCODER_MSG',
     'command_msg_map',
+    'LSProtocol',
     'SafetyInterface',
     'SafetyInterfaceError',
     'SafetyInterfaceConnectionError',
     'SafetyInterfaceTimeout',
     'read_cliff_sensor',
     'read_encoder',
+    'read_all_cliff_sensors',
+    'close_safety_interfaces',
 ]
@@ -25,11 +25,19 @@ import asyncio
 import zlib
 import struct
 import logging
-from collections import deque
-from typing import Tuple, Optional
+from functools import lru_cache
+from typing import Dict, Iterable, List, Tuple, Optional
+
+# Prefer pyserial-asyncio-fast (eager writes skip add_writer/remove_writer per
+# packet); the API is identical to pyserial-asyncio
+try:
+    from serial_asyncio_fast import create_serial_connection
+except ImportError:
+    from serial_asyncio import create_serial_connection
 
 from .ls_msgs import (
-    MsgHeader,
+    HDR,
+    BODY,
     CliffMsgBody_t,
     EncoderMsgBody_t,
     CLIFF_MSG,
@@ -46,6 +54,20 @@ HEADER_SIZE = 12  # MsgHeader size in bytes
 SYNC_BYTE_1 = 0xCA
 SYNC_BYTE_2 = 0xFE
 SYNC_WORD = 0xFECA  # Little-endian
+SYNC_BYTES = bytes([SYNC_BYTE_1, SYNC_BYTE_2])  # Sync word as it appears on the wire
+
+# CRC of the header tail (message_format=0, reserved=0) every outgoing frame uses
+_HEADER_CRC_SEED = zlib.crc32(bytes(HEADER_SIZE - CRC_OFFSET)) & 0xFFFFFFFF
+
+# Complete outgoing frame: HDR followed by BODY
+_FRAME_STRUCT = struct.Struct(HDR.format + BODY.format.lstrip("<"))
+# HDR without the sync word, which the framer has already matched
+_HDR_AFTER_SYNC = struct.Struct("<HIHH")  # length, crc, message_format, reserved
+# Return value at the start of a reply body
+_U16_LE = struct.Struct("<H")
+
+# Initial size of the LSProtocol receive buffer (grown for longer frames)
+RX_BUFFER_SIZE = 4096
 
 
 class SafetyInterfaceError(Exception):
@@ -68,6 +90,8 @@ def get_crc(frame_header_str: bytes, complete_serialized_body_str: bytes) -> int
     Calculate CRC32 checksum for LS protocol.
 
     CRC covers everything from offset 8 onwards (message_format + body).
+    The LS firmware checks IEEE 802.3 CRC32 (zlib.crc32), so hardware
+    CRC32C (Castagnoli) implementations are not interchangeable here.
 
     Args:
         frame_header_str: Serialized header (12 bytes)
@@ -77,12 +101,192 @@ def get_crc(frame_header_str: bytes, complete_serialized_body_str: bytes) -> int
         int: CRC32 checksum
     """
     # Skip sync (2), length (2), crc (4) = 8 bytes
-    trimmed_header_str = frame_header_str[CRC_OFFSET:]
-    header_crc_part = zlib.crc32(trimmed_header_str) & 0xFFFFFFFF
+    header_crc_part = _header_crc_seed(bytes(frame_header_str[CRC_OFFSET:]))
     crc = zlib.crc32(complete_serialized_body_str, header_crc_part) & 0xFFFFFFFF
     return crc
 
 
+@lru_cache(maxsize=16)
+def _header_crc_seed(trimmed_header_str: bytes) -> int:
+    """CRC32 of the header tail, memoized since message_format rarely varies."""
+    return zlib.crc32(trimmed_header_str) & 0xFFFFFFFF
+
+
+def get_body_crc(complete_serialized_body_str: bytes) -> int:
+    """
+    Calculate the frame CRC32 for a body sent with the default header.
+
+    Equivalent to get_crc() with message_format=0 and reserved=0, but reuses
+    the precomputed header seed so only the body is hashed.
+
+    Args:
+        complete_serialized_body_str: Serialized body
+
+    Returns:
+        int: CRC32 checksum
+    """
+    return zlib.crc32(complete_serialized_body_str, _HEADER_CRC_SEED) & 0xFFFFFFFF
+
+
+@lru_cache(maxsize=512)
+def _build_frame(command: int, params: int) -> bytes:
+    """
+    Pack a complete request frame.
+
+    A frame depends only on (command, params), which fit in two bytes, so
+    every frame is built once and then served from the cache.
+    """
+    # Validate command type (raises ValueError if unknown)
+    get_command_msg_class(command)
+
+    try:
+        # Body layout is identical for CliffMsgBody_t and EncoderMsgBody_t
+        msg_body_string = BODY.pack(command, params)
+
+        # CRC over header tail (message_format=0, reserved=0) + body
+        crc = get_body_crc(msg_body_string)
+
+        # Pack header and body in one go
+        return _FRAME_STRUCT.pack(
+            SYNC_WORD, len(msg_body_string), crc, 0, 0, command, params
+        )
+    except struct.error as e:
+        raise ValueError(f"Failed to create message for command {command}: {e}") from e
+
+
+class LSProtocol(asyncio.BufferedProtocol):
+    """
+    Serial protocol that frames LS replies as bytes arrive.
+
+    Incoming data lands in one preallocated buffer: directly through
+    get_buffer()/buffer_updated() on transports that support buffered
+    reads, or copied in by data_received() on those that do not (the
+    pyserial-asyncio transports). The buffer is scanned for the 0xCAFE
+    sync word, and every complete frame (header + body) is copied out
+    once and queued for read_frame().
+    """
+
+    def __init__(self, buffer_size: int = RX_BUFFER_SIZE):
+        self.transport: Optional[asyncio.BaseTransport] = None
+        self._buf = bytearray(buffer_size)
+        self._view = memoryview(self._buf)
+        self._start = 0  # First byte not yet consumed by the framer
+        self._end = 0    # End of received data
+        self._need = 0   # Bytes from _start the pending frame needs (0 = not yet known)
+        self._frames: asyncio.Queue = asyncio.Queue()
+        self._can_write = asyncio.Event()
+        self._can_write.set()
+        self._closed = asyncio.Event()
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        self.transport = transport
+
+    def connection_lost(self, exc: Optional[Exception]) -> None:
+        pending = self._end - self._start
+        if pending >= len(SYNC_BYTES) and self._buf.startswith(SYNC_BYTES, self._start):
+            part = "header" if pending < HEADER_SIZE else "body"
+            error = SafetyInterfaceError(
+                f"Incomplete {part}: connection closed with {pending} bytes of a frame pending"
+            )
+        else:
+            error = SafetyInterfaceTimeout("Stream ended before sync word 0xCAFE was found")
+        self._frames.put_nowait(error)
+        self._can_write.set()
+        self._closed.set()
+
+    def pause_writing(self) -> None:
+        self._can_write.clear()
+
+    def resume_writing(self) -> None:
+        self._can_write.set()
+
+    def get_buffer(self, sizehint: int) -> memoryview:
+        if self._end == len(self._buf):
+            self._make_room(max(sizehint, 1))
+        return self._view[self._end:]
+
+    def buffer_updated(self, nbytes: int) -> None:
+        self._end += nbytes
+        # A partially received frame is already located; skip the scan until it completes
+        if self._end - self._start >= self._need:
+            self._parse_frames()
+
+    def data_received(self, data: bytes) -> None:
+        nbytes = len(data)
+        if self._end + nbytes > len(self._buf):
+            self._make_room(nbytes)
+        self._view[self._end:self._end + nbytes] = data
+        self.buffer_updated(nbytes)
+
+    def _make_room(self, needed: int) -> None:
+        """Move unconsumed data to the front, growing the buffer if still too small."""
+        pending = self._end - self._start
+        if pending + needed > len(self._buf):
+            buf = bytearray(max(2 * len(self._buf), pending + needed))
+            buf[:pending] = self._view[self._start:self._end]
+            self._buf = buf
+            self._view = memoryview(buf)
+        elif self._start:
+            self._view[:pending] = self._view[self._start:self._end]
+        self._start = 0
+        self._end = pending
+
+    def _parse_frames(self) -> None:
+        """Queue every complete frame in the buffer, discarding noise before sync."""
+        buf = self._buf
+        while True:
+            index = buf.find(SYNC_BYTES, self._start, self._end)
+            if index < 0:
+                self._need = 0
+                # Keep a trailing 0xCA: its 0xFE may be in the next chunk
+                if self._end > self._start and buf[self._end - 1] == SYNC_BYTE_1:
+                    self._start = self._end - 1
+                else:
+                    self._start = self._end
+                break
+
+            self._start = index
+            if self._end - index < HEADER_SIZE:
+                self._need = HEADER_SIZE
+                break
+            length = _U16_LE.unpack_from(buf, index + len(SYNC_BYTES))[0]
+            frame_end = index + HEADER_SIZE + length
+            if frame_end > self._end:
+                self._need = HEADER_SIZE + length
+                break
+
+            self._frames.put_nowait(bytes(self._view[index:frame_end]))
+            self._start = frame_end
+            self._need = 0
+
+        if self._start == self._end:
+            self._start = self._end = 0
+
+    async def read_frame(self) -> bytes:
+        """
+        Wait for the next complete frame.
+
+        Raises:
+            SafetyInterfaceError: If the connection was lost
+        """
+        item = await self._frames.get()
+        if isinstance(item, Exception):
+            # Leave the error queued so later reads fail the same way
+            self._frames.put_nowait(item)
+            raise item
+        return item
+
+    async def drain(self) -> None:
+        """Wait until the transport's write buffer is below its high-water mark."""
+        if self._closed.is_set():
+            raise SafetyInterfaceError("Connection lost")
+        await self._can_write.wait()
+
+    async def wait_closed(self) -> None:
+        """Wait until the connection has been lost or closed."""
+        await self._closed.wait()
+
+
 class SafetyInterface:
     """
     Async serial interface for LS series safety devices.
@@ -112,8 +316,8 @@ class SafetyInterface:
         self.port_name = port_name
         self.baudrate = baudrate
         self.timeout = timeout
-        self._reader: Optional[asyncio.StreamReader] = None
-        self._writer: Optional[asyncio.StreamWriter] = None
+        self._transport: Optional[asyncio.Transport] = None
+        self._protocol: Optional[LSProtocol] = None
         self._connected = False
 
     async def open(self) -> None:
@@ -124,33 +328,20 @@ class SafetyInterface:
             SafetyInterfaceConnectionError: If connection fails
         """
         try:
-            # Import pyserial-asyncio
-            from serial_asyncio import create_serial_connection
-
-            # Create serial connection
-            class SerialProtocol(asyncio.Protocol):
-                def __init__(self):
-                    self.transport = None
-
-                def connection_made(self, transport):
-                    self.transport = transport
-
-                def data_received(self, data):
-                    pass  # Data handled by StreamReader
-
-                def connection_lost(self, exc):
-                    pass
-
-            # Open connection using serial_asyncio
-            reader, writer = await create_serial_connection(
-                asyncio.get_event_loop(),
-                lambda: SerialProtocol(),
+            # LSProtocol frames replies itself, so no StreamReader is involved
+            transport, protocol = await create_serial_connection(
+                asyncio.get_running_loop(),
+                LSProtocol,
                 self.port_name,
                 baudrate=self.baudrate,
             )
 
-            self._reader = reader
-            self._writer = writer
+            # Zero high-water mark: drain() waits until the packet has actually
+            # been handed to the UART, keeping a single request in flight
+            transport.set_write_buffer_limits(high=0)
+
+            self._transport = transport
+            self._protocol = protocol
             self._connected = True
 
             logger.info(f"Connected to {self.port_name} at {self.baudrate} baud")
@@ -162,15 +353,15 @@ class SafetyInterface:
 
     async def close(self) -> None:
         """Close serial connection."""
-        if self._writer:
-            self._writer.close()
+        if self._transport:
+            self._transport.close()
             try:
-                await self._writer.wait_closed()
+                await self._protocol.wait_closed()
             except asyncio.CancelledError:
                 pass
 
-        self._reader = None
-        self._writer = None
+        self._transport = None
+        self._protocol = None
         self._connected = False
 
         logger.info(f"Closed connection to {self.port_name}")
@@ -190,37 +381,11 @@ class SafetyInterface:
 
         Returns:
             bytes: Complete message packet (header + body)
-        """
-        # Get message body class
-        msg_class = get_command_msg_class(command)
-
-        # Create and populate message body
-        body = msg_class()
-        body.command = command
-        body.params = params
-
-        # Serialize body
-        msg_body_string = body.serialize()
-
-        # Create header
-        header = MsgHeader()
-        header.sync = SYNC_WORD
-        header.length = len(msg_body_string)
-        header.message_format = 0
-        header.reserved = 0
-
-        # Calculate CRC
-        header_str = struct.pack("<HHIHH",
-            header.sync, header.length, 0,  # CRC placeholder
-            header.message_format, header.reserved
-        )
-        header.crc = get_crc(header_str, msg_body_string)
 
-        # Serialize complete header
-        header_string = header.serialize()
-
-        # Combine header and body
-        return header_string + msg_body_string
+        Raises:
+            ValueError: If the command is unknown or params do not fit a byte
+        """
+        return _build_frame(command, params)
 
     async def send_packet(self, msg_packet: bytes) -> None:
         """
@@ -232,14 +397,14 @@ class SafetyInterface:
         Raises:
             SafetyInterfaceError: If not connected or send fails
         """
-        if not self._connected or not self._writer:
+        if not self._connected or not self._transport:
             raise SafetyInterfaceError("Not connected to device")
 
         try:
-            self._writer.write(msg_packet)
-            await self._writer.drain()
+            self._transport.write(msg_packet)
+            await self._protocol.drain()
 
-            logger.debug(f"Sent {len(msg_packet)} bytes")
+            logger.debug("Sent %d bytes", len(msg_packet))
 
         except Exception as e:
             raise SafetyInterfaceError(f"Failed to send packet: {e}") from e
@@ -248,103 +413,73 @@ class SafetyInterface:
         """
         Receive and parse a response packet from the device.
 
-        Implements 3-step frame detection:
-        1. Detect 0xCA sync byte
-        2. Detect 0xFE sync byte
-        3. Read length and parse complete frame
+        Frames are detected by LSProtocol as data arrives:
+        1. Scan the stream for the 0xCA 0xFE sync word (leading noise is skipped)
+        2. Wait for the rest of the header
+        3. Read length and wait for the complete frame; its CRC32 is verified here
 
         Returns:
             Tuple of (received_packet, return_value)
 
         Raises:
-            SafetyInterfaceTimeout: If no data received within timeout
-            SafetyInterfaceError: If parsing fails
+            SafetyInterfaceTimeout: If no complete frame arrives within timeout
+            SafetyInterfaceError: If parsing fails or the CRC does not match
         """
-        if not self._connected or not self._reader:
+        if not self._connected or not self._protocol:
             raise SafetyInterfaceError("Not connected to device")
 
         try:
-            # Step 1: Detect 0xCA
-            data = await asyncio.wait_for(
-                self._reader.read(1),
-                timeout=self.timeout
-            )
-            if not data or data[0] != SYNC_BYTE_1:
-                raise SafetyInterfaceError("Sync byte 1 (0xCA) not found")
-
-            # Step 2: Detect 0xFE
-            data = await asyncio.wait_for(
-                self._reader.read(1),
-                timeout=self.timeout
-            )
-            if not data or data[0] != SYNC_BYTE_2:
-                raise SafetyInterfaceError("Sync byte 2 (0xFE) not found")
-
-            # Step 3: Read remaining header (10 bytes after sync)
-            header_rest = await asyncio.wait_for(
-                self._reader.read(10),
-                timeout=self.timeout
-            )
-            if len(header_rest) < 10:
-                raise SafetyInterfaceError("Incomplete header")
-
-            # Parse full header
-            header_bytes = bytes([SYNC_BYTE_1, SYNC_BYTE_2]) + header_rest
-            header = MsgHeader()
-            header.deserialize(header_bytes)
-
-            # Validate sync
-            if header.sync != SYNC_WORD:
-                raise SafetyInterfaceError(f"Invalid sync word: {hex(header.sync)}")
-
-            # Read message body
-            if header.length > 0:
-                body_bytes = await asyncio.wait_for(
-                    self._reader.read(header.length),
-                    timeout=self.timeout
-                )
-                if len(body_bytes) < header.length:
-                    raise SafetyInterfaceError(f"Incomplete body: expected {header.length}, got {len(body_bytes)}")
-            else:
-                body_bytes = b''
-
-            # Combine header and body
-            recv_packet = header_bytes + body_bytes
-
-            # Extract return value based on command type
-            return_value = self._extract_return_value(header, body_bytes)
-
-            logger.debug(f"Received {len(recv_packet)} bytes, return value: {return_value}")
-
-            return recv_packet, return_value
+            # One timer bounds the whole frame
+            frame = await asyncio.wait_for(self._protocol.read_frame(), timeout=self.timeout)
+            return self._parse_frame(frame)
 
         except asyncio.TimeoutError:
             raise SafetyInterfaceTimeout(
                 f"No data received within {self.timeout} seconds"
             ) from None
+        except SafetyInterfaceError:
+            raise
         except Exception as e:
             raise SafetyInterfaceError(f"Failed to receive packet: {e}") from e
 
-    def _extract_return_value(self, header: MsgHeader, body_bytes: bytes) -> int:
+    def _parse_frame(self, frame: bytes) -> Tuple[bytes, int]:
+        """Validate a complete frame from LSProtocol and extract its return value."""
+        # Sync is already known to be 0xCAFE; parse the remaining fields only
+        length, crc, _message_format, _reserved = _HDR_AFTER_SYNC.unpack_from(frame, len(SYNC_BYTES))
+
+        # Validate CRC over header tail + body without slicing copies
+        view = memoryview(frame)
+        expected_crc = zlib.crc32(view[CRC_OFFSET:]) & 0xFFFFFFFF
+        if expected_crc != crc:
+            raise SafetyInterfaceError(
+                f"CRC mismatch: received 0x{crc:08X}, calculated 0x{expected_crc:08X}"
+            )
+
+        # Extract return value based on command type
+        return_value = self._extract_return_value(length, view[HEADER_SIZE:])
+
+        logger.debug("Received %d bytes, return value: %s", len(frame), return_value)
+
+        return frame, return_value
+
+    def _extract_return_value(self, length: int, body_bytes: bytes) -> int:
         """
         Extract return value from response based on command type.
 
         Args:
-            header: Parsed message header
+            length: Body length from the message header
             body_bytes: Raw message body bytes
 
         Returns:
             int: Extracted return value
         """
-        # Default: try to parse as integer from body
-        if len(body_bytes) >= 2:
-            # Cliff sensor: returns millivolts (2 bytes)
-            # Encoder: returns speed (4 bytes but we use first 2)
-            try:
-                return int.from_bytes(body_bytes[:2], byteorder='little')
-            except:
-                return 0
-        return 0
+        # Cliff sensor: returns millivolts (2 bytes)
+        # Encoder: returns speed (4 bytes but we use first 2)
+        try:
+            return _U16_LE.unpack_from(body_bytes)[0]
+        except struct.error:
+            # Body shorter than 2 bytes
+            return 0
 
     async def __aenter__(self):
         """Async context manager entry."""
@@ -356,6 +491,79 @@ class SafetyInterface:
         await self.close()
 
 
+# Shared connections, one open SafetyInterface per serial port
+_connections: Dict[str, SafetyInterface] = {}
+# One lock per port keeps request/response exchanges from interleaving on the wire
+_port_locks: Dict[str, asyncio.Lock] = {}
+
+# Cliff sensors polled by read_all_cliff_sensors by default
+CLIFF_SENSOR_IDS = (1, 2, 3, 4, 5)
+
+
+def _port_lock(port_name: str) -> asyncio.Lock:
+    """Return the lock serializing traffic on a port (created inside the running loop)."""
+    lock = _port_locks.get(port_name)
+    if lock is None:
+        lock = _port_locks[port_name] = asyncio.Lock()
+    return lock
+
+
+async def _get_si(port_name: str, baudrate: int) -> SafetyInterface:
+    """
+    Return the shared SafetyInterface for a port, opening it if needed.
+
+    Must be called with the port's lock held.
+
+    Args:
+        port_name: Serial port device path
+        baudrate: Communication speed; a different rate reopens the port
+
+    Returns:
+        SafetyInterface: Connected interface
+    """
+    si = _connections.get(port_name)
+    if si is not None and si.is_connected and si.baudrate == baudrate:
+        return si
+    if si is not None:
+        await si.close()
+
+    si = SafetyInterface(port_name, baudrate)
+    await si.open()
+    _connections[port_name] = si
+    return si
+
+
+async def _discard_si(si: SafetyInterface) -> None:
+    """Close a shared interface whose stream state is unknown after an error."""
+    if _connections.get(si.port_name) is si:
+        del _connections[si.port_name]
+    await si.close()
+
+
+async def close_safety_interfaces() -> None:
+    """Close all shared SafetyInterface connections (application shutdown hook)."""
+    while _connections:
+        _, si = _connections.popitem()
+        try:
+            await si.close()
+        except Exception as e:
+            logger.warning(f"Error closing {si.port_name}: {e}")
+
+
+async def _query(port_name: str, baudrate: int, command: int, params: int) -> int:
+    """Send one request on the shared connection and return the reply value."""
+    async with _port_lock(port_name):
+        si = await _get_si(port_name, baudrate)
+        try:
+            await si.send_packet(si.create_msg(command, params))
+            _, value = await si.receive_packet()
+            return value
+        except SafetyInterfaceError:
+            # Drop the connection so the next call starts from a clean stream
+            await _discard_si(si)
+            raise
+
+
 # Convenience functions for common operations
 
 async def read_cliff_sensor(
@@ -374,16 +582,8 @@ async def read_cliff_sensor(
     Returns:
         float: Sensor voltage in millivolts
     """
-    si = SafetyInterface(port_name, baudrate)
-    await si.open()
-
-    try:
-        packet = si.create_msg(CLIFF_MSG, sensor_id)
-        await si.send_packet(packet)
-        _, voltage = await si.receive_packet()
-        return float(voltage)
-    finally:
-        await si.close()
+    voltage = await _query(port_name, baudrate, CLIFF_MSG, sensor_id)
+    return float(voltage)
 
 
 async def read_encoder(
@@ -402,13 +602,41 @@ async def read_encoder(
     Returns:
         float: Encoder speed
     """
-    si = SafetyInterface(port_name, baudrate)
-    await si.open()
+    speed = await _query(port_name, baudrate, ENCODER_MSG, encoder_id)
+    return float(speed)
 
-    try:
-        packet = si.create_msg(ENCODER_MSG, encoder_id)
-        await si.send_packet(packet)
-        _, speed = await si.receive_packet()
-        return float(speed)
-    finally:
-        await si.close()
+
+async def read_all_cliff_sensors(
+    port_name: str,
+    sensor_ids: Iterable[int] = CLIFF_SENSOR_IDS,
+    baudrate: int = 9600
+) -> List[float]:
+    """
+    Read several cliff sensors with pipelined requests.
+
+    All requests are written back-to-back in a single write, then the
+    replies are read in order, so the link is not idle for a round trip
+    between sensors.
+
+    Args:
+        port_name: Serial port device path
+        sensor_ids: Sensor IDs to read (default 1-5)
+        baudrate: Communication speed (default 9600)
+
+    Returns:
+        List[float]: Sensor voltages in millivolts, in sensor_ids order
+    """
+    async with _port_lock(port_name):
+        si = await _get_si(port_name, baudrate)
+        try:
+            packets = [si.create_msg(CLIFF_MSG, sensor_id) for sensor_id in sensor_ids]
+            await si.send_packet(b''.join(packets))
+
+            voltages = []
+            for _ in packets:
+                _, voltage = await si.receive_packet()
+                voltages.append(float(voltage))
+            return voltages
+        except SafetyInterfaceError:
+            await _discard_si(si)
+            raise
@@ -15,7 +15,6 @@ Message Format:
     Offset 14:     Sensor: 1 byte
     Offset 15+:    Params: variable
 """
-from collections import OrderedDict
 import struct
 import ctypes
 from app.services.dut_comms.common.struct_message import StructMessage as BaseStructMessage
@@ -24,35 +23,40 @@ from app.services.dut_comms.common.struct_message import StructMessage as BaseSt
 # Re-export base class for compatibility
 StructMessage = BaseStructMessage
 
+# Precompiled layouts used directly on the send/receive path; the message
+# classes below share these formats for code that prefers named fields
+HDR = struct.Struct("<HHIHH")   # sync, length, crc, message_format, reserved
+BODY = struct.Struct("<BB")     # command, params
+
 
 class MsgHeader(StructMessage):
     """LS message header (12 bytes)."""
-    fields = OrderedDict([
-        ("sync", ctypes.c_uint16),        # 0xCAFE
-        ("length", ctypes.c_uint16),      # Message body length
-        ("crc", ctypes.c_uint32),         # CRC32 checksum
-        ("message_format", ctypes.c_uint16),  # Message format
-        ("reserved", ctypes.c_uint16),    # Reserved
-    ])
-    pack_str = "<HHIHH"
+    fields = {
+        "sync": ctypes.c_uint16,        # 0xCAFE
+        "length": ctypes.c_uint16,      # Message body length
+        "crc": ctypes.c_uint32,         # CRC32 checksum
+        "message_format": ctypes.c_uint16,  # Message format
+        "reserved": ctypes.c_uint16,    # Reserved
+    }
+    pack_str = HDR.format
 
 
 class CliffMsgBody_t(StructMessage):
     """Cliff sensor message body (2 bytes)."""
-    fields = OrderedDict([
-        ("command", ctypes.c_uint8),      # Command ID
-        ("params", ctypes.c_uint8),       # Parameters
-    ])
-    pack_str = "<BB"
+    fields = {
+        "command": ctypes.c_uint8,      # Command ID
+        "params": ctypes.c_uint8,       # Parameters
+    }
+    pack_str = BODY.format
 
 
 class EncoderMsgBody_t(StructMessage):
     """Encoder message body (2 bytes)."""
-    fields = OrderedDict([
-        ("command", ctypes.c_uint8),      # Command ID
-        ("params", ctypes.c_uint8),       # Parameters
-    ])
-    pack_str = "<BB"
+    fields = {
+        "command": ctypes.c_uint8,      # Command ID
+        "params": ctypes.c_uint8,       # Parameters
+    }
+    pack_str = BODY.format
 
 
 # Command type definitions
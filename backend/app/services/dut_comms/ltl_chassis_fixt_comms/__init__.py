@@ -62,6 +62,7 @@ from .chassis_msgs import (
     serialize,
     deserialize,
     get_msg_size,
+    response_class,
     type_msg_map,
     SYNC_WORD,
     TRANSPORT_OVERHEAD,
@@ -107,6 +108,7 @@ __all__ = [
     'serialize',
     'deserialize',
     'get_msg_size',
+    'response_class',
     'type_msg_map',
     'SYNC_WORD',
     'TRANSPORT_OVERHEAD',
@@ -4,24 +4,27 @@ Chassis Test Fixture Message Definitions
 Refactored from PDTool4 polish/dut_comms/ltl_chassis_fixt_comms/chassis_msgs.py
 
 All messages use big-endian byte order (network byte order).
-Auto-registration system builds type_msg_map and req_rsp_map at module load time.
+Auto-registration system builds type_msg_map at module load time.
 """
 
+import operator
 import struct
 import sys
 from enum import Enum
 from ctypes import c_uint8, c_uint16, c_uint32
-from collections import OrderedDict
 from inspect import isclass
-from typing import Any, Dict, Type
+from typing import Any, Callable, Dict, Optional, Tuple, Type
 
 
 # Global registries
 type_msg_map: Dict[int, Type['LittleChassisTestMessage']] = {}
-req_rsp_map: Dict[Type['LittleChassisTestMessage'], Type['LittleChassisTestMessage']] = {}
 msg_packing_format_map: Dict[Type['LittleChassisTestMessage'], str] = {}
+msg_struct_map: Dict[Type['LittleChassisTestMessage'], struct.Struct] = {}
 enum_map: Dict[str, Type[Enum]] = {}
 
+# struct format character for each ctypes field type (network byte order, standard sizes)
+_CTYPE_CHAR = {c_uint8: 'B', c_uint16: 'H', c_uint32: 'I'}
+
 # Protocol constants
 SYNC_WORD = 0xA5FF00CC
 TRANSPORT_OVERHEAD: int = 0  # Will be set after message registration
@@ -57,10 +60,13 @@ class operation_enum(Enum):
 # Base message class
 class LittleChassisTestMessage:
     """Base class for all chassis test messages"""
+    __slots__ = ()  # Subclasses get slots from their fields at registration
     msg_type: int = 0
-    fields: OrderedDict = OrderedDict()
-    name_type_map: OrderedDict = OrderedDict()
+    fields: dict = {}
+    name_type_map: dict = {}
     field_enum_map: Dict[str, Type[Enum]] = {}
+    _size: int = 0  # Serialized size, set at registration
+    _field_values = staticmethod(lambda msg_inst: ())  # Field tuple getter, set at registration
 
     def __init__(self):
         for name in self.fields:
@@ -75,152 +81,204 @@ class LittleChassisTestMessage:
 class TransportHeader(LittleChassisTestMessage):
     """Transport layer header"""
     msg_type = -10
-    fields = OrderedDict((
-        ('sync_word', c_uint32),
-        ('length', c_uint16),
-        ('msg_type', c_uint16),
-    ))
+    fields = {
+        'sync_word': c_uint32,
+        'length': c_uint16,
+        'msg_type': c_uint16,
+    }
 
 
 class TransportFooter(LittleChassisTestMessage):
     """Transport layer footer with CRC16"""
     msg_type = -9
-    fields = OrderedDict((
-        ('crc16', c_uint16),
-    ))
+    fields = {
+        'crc16': c_uint16,
+    }
 
 
 # Application messages
 class ActuateCliffSensorDoor(LittleChassisTestMessage):
     """Command to open/close cliff sensor door"""
     msg_type = 0x10
-    fields = OrderedDict((
-        ('door_number', c_uint8),
-        ('close_open', (c_uint8, close_open_enum)),
-    ))
+    fields = {
+        'door_number': c_uint8,
+        'close_open': (c_uint8, close_open_enum),
+    }
 
 
 class ActuateCliffSensorDoorStatus(LittleChassisTestMessage):
     """Response for cliff sensor door actuation"""
     msg_type = 0x11
-    fields = OrderedDict((
-        ('status', (c_uint8, status_enum)),
-    ))
+    fields = {
+        'status': (c_uint8, status_enum),
+    }
 
 
 class ReadEncoderCount(LittleChassisTestMessage):
     """Command to read encoder count"""
     msg_type = 0x12
-    fields = OrderedDict((
-        ('left_right', (c_uint8, left_right_enum)),
-    ))
+    fields = {
+        'left_right': (c_uint8, left_right_enum),
+    }
 
 
 class EncoderCount(LittleChassisTestMessage):
     """Response with encoder count value"""
     msg_type = 0x13
-    fields = OrderedDict((
-        ('status', (c_uint8, status_enum)),
-        ('count', c_uint32),
-    ))
+    fields = {
+        'status': (c_uint8, status_enum),
+        'count': c_uint32,
+    }
 
 
 class WaitForTurntable(LittleChassisTestMessage):
     """Command to wait for turntable operation"""
     msg_type = 0x14
-    fields = OrderedDict((
-        ('timeout_seconds', c_uint8),
-    ))
+    fields = {
+        'timeout_seconds': c_uint8,
+    }
 
 
 class WaitForTurntableStatus(LittleChassisTestMessage):
     """Response for turntable wait operation"""
     msg_type = 0x15
-    fields = OrderedDict((
-        ('status', (c_uint8, status_enum)),
-    ))
+    fields = {
+        'status': (c_uint8, status_enum),
+    }
 
 
 class RotateTurntable(LittleChassisTestMessage):
     """Command to rotate turntable"""
     msg_type = 0x16
-    fields = OrderedDict((
-        ('operation', (c_uint8, operation_enum)),
-        ('angle', c_uint16),
-    ))
+    fields = {
+        'operation': (c_uint8, operation_enum),
+        'angle': c_uint16,
+    }
 
 
 class RotateTurntableStatus(LittleChassisTestMessage):
     """Response for turntable rotation"""
     msg_type = 0x17
-    fields = OrderedDict((
-        ('status', (c_uint8, status_enum)),
-    ))
+    fields = {
+        'status': (c_uint8, status_enum),
+    }
 
 
 class GetTurntableAngle(LittleChassisTestMessage):
     """Command to get current turntable angle"""
     msg_type = 0x1A
-    fields = OrderedDict()
+    fields = {}
 
 
 class TurntableAngleRsp(LittleChassisTestMessage):
     """Response with current turntable angle"""
     msg_type = 0x1B
-    fields = OrderedDict((
-        ('angle', c_uint16),
-    ))
+    fields = {
+        'angle': c_uint16,
+    }
 
 
 # Utility functions
 def get_msg_size(msg: Any) -> int:
-    """Get the serialized size of a message"""
-    try:
-        return struct.calcsize(msg_packing_format_map[msg])
-    except KeyError:
-        return struct.calcsize(msg_packing_format_map[type(msg)])
+    """Get the serialized size of a message class or instance"""
+    return msg._size
+
+
+def response_class(req_cls: Type[LittleChassisTestMessage]) -> Optional[Type[LittleChassisTestMessage]]:
+    """Get the response class for a request class (even msg_type -> msg_type + 1)"""
+    if req_cls.msg_type % 2 or req_cls.msg_type < 0:
+        return None
+    return type_msg_map.get(req_cls.msg_type + 1)
 
 
-def get_values(msg_inst: LittleChassisTestMessage) -> list:
+def get_values(msg_inst: LittleChassisTestMessage) -> Tuple[Any, ...]:
     """Extract field values from message instance"""
-    values = []
-    for name in msg_inst.fields:
-        values.append(getattr(msg_inst, name))
-    return values
+    return msg_inst._field_values(msg_inst)
 
 
 def serialize(msg_inst: LittleChassisTestMessage) -> bytes:
     """Serialize message to bytes"""
-    return struct.pack(msg_packing_format_map[type(msg_inst)], *get_values(msg_inst))
+    if not msg_inst.fields:
+        return b''  # Field-less commands (e.g. GetTurntableAngle) have no payload
+    return msg_struct_map[type(msg_inst)].pack(*get_values(msg_inst))
+
+
+def pack_into(msg_inst: LittleChassisTestMessage, buffer: bytearray, offset: int = 0) -> int:
+    """Serialize message into a writable buffer at offset; returns the offset past it"""
+    if not msg_inst.fields:
+        return offset
+    packer = msg_struct_map[type(msg_inst)]
+    packer.pack_into(buffer, offset, *get_values(msg_inst))
+    return offset + packer.size
 
 
 def deserialize(msg_class: Type[LittleChassisTestMessage], msg_blob: bytes) -> LittleChassisTestMessage:
     """Deserialize bytes to message instance"""
-    msg = msg_class()
-    values = struct.unpack(msg_packing_format_map[msg_class], msg_blob)
+    # Every field is assigned below, so skip __init__'s None-fill pass
+    msg = msg_class.__new__(msg_class)
+    values = msg_struct_map[msg_class].unpack(msg_blob)
     for name, value in zip(msg_class.fields, values):
         setattr(msg, name, value)
     return msg
 
 
-def build_msg_packing_format(msg: Type[LittleChassisTestMessage]) -> str:
-    """Build struct packing format string for message"""
-    # Add type map
-    msg.name_type_map = OrderedDict()
-    str_source = ['!']  # Network byte order (big-endian)
-
-    for name, definition in msg.fields.items():
-        try:
-            ct_type = definition[0]
-        except (TypeError, IndexError):
-            ct_type = definition
-
-        format_type = ct_type._type_
-        str_source.append(format_type)
+def deserialize_from(msg_class: Type[LittleChassisTestMessage], buffer: bytearray, offset: int = 0) -> LittleChassisTestMessage:
+    """Deserialize a message from a buffer at offset without slicing it out first"""
+    msg = msg_class.__new__(msg_class)
+    values = msg_struct_map[msg_class].unpack_from(buffer, offset)
+    for name, value in zip(msg_class.fields, values):
+        setattr(msg, name, value)
+    return msg
 
-        msg.name_type_map[name] = ct_type
 
-    return ''.join(str_source)
+def build_msg_packing_format(msg: Type[LittleChassisTestMessage]) -> str:
+    """Build struct packing format string for message"""
+    # Add type map; enum fields are declared as (ctype, enum)
+    msg.name_type_map = {
+        name: definition[0] if isinstance(definition, tuple) else definition
+        for name, definition in msg.fields.items()
+    }
+    # Network byte order (big-endian)
+    return '!' + ''.join(_CTYPE_CHAR[ct_type] for ct_type in msg.name_type_map.values())
+
+
+def build_values_getter(msg: Type[LittleChassisTestMessage]) -> Callable[[Any], Tuple[Any, ...]]:
+    """Build a callable returning a message's field values as a tuple in one C-level call"""
+    names = tuple(msg.fields)
+    if len(names) > 1:
+        return operator.attrgetter(*names)
+    if names:
+        getter = operator.attrgetter(names[0])
+        return lambda msg_inst: (getter(msg_inst),)
+    return lambda msg_inst: ()
+
+
+def build_slotted_class(msg: Type[LittleChassisTestMessage]) -> Type[LittleChassisTestMessage]:
+    """
+    Recreate a message class with __slots__ built from its fields.
+
+    Classes that already declare __slots__, or whose field names shadow a
+    class attribute (e.g. TransportHeader.msg_type), are returned unchanged.
+    """
+    if '__slots__' in msg.__dict__ or any(hasattr(msg, name) for name in msg.fields):
+        return msg
+    namespace = {k: v for k, v in msg.__dict__.items() if k not in ('__dict__', '__weakref__')}
+    # Enum fields store their value under '_<name>' behind an enum_field property
+    namespace['__slots__'] = tuple(
+        f'_{name}' if isinstance(definition, tuple) else name
+        for name, definition in msg.fields.items()
+    )
+    return type(msg.__name__, msg.__bases__, namespace)
+
+
+def enum_field(name: str) -> property:
+    """Property for an enum field that stores the raw int, coercing Enum members on set"""
+    slot = f'_{name}'
+
+    def fset(self, value):
+        setattr(self, slot, value.value if isinstance(value, Enum) else value)
+
+    return property(operator.attrgetter(slot), fset)
 
 
 def build_enum_map(msg: Type[LittleChassisTestMessage]) -> Dict[str, Type[Enum]]:
@@ -242,22 +300,23 @@ for name in dir(module):
     obj = getattr(module, name)
     # Register message classes
     if hasattr(obj, 'msg_type') and hasattr(obj, 'fields'):
-        msg = obj
+        # Swap in the slotted class so later imports only ever see that one
+        msg = build_slotted_class(obj)
+        setattr(module, name, msg)
         module.type_msg_map[msg.msg_type] = msg
         module.msg_packing_format_map[msg] = build_msg_packing_format(msg)
+        # Compiled once so serialize/deserialize never re-parse the format
+        module.msg_struct_map[msg] = struct.Struct(module.msg_packing_format_map[msg])
+        msg._size = module.msg_struct_map[msg].size
+        msg._field_values = staticmethod(build_values_getter(msg))
         msg.field_enum_map = build_enum_map(msg)
+        for field_name in msg.field_enum_map:
+            setattr(msg, field_name, enum_field(field_name))
 
     # Register enum classes
     if obj is not Enum and isclass(obj) and issubclass(obj, Enum):
         module.enum_map[obj.__name__] = obj
 
-# Build request-response map (even msg_type -> odd msg_type + 1)
-for msg_type, msg in module.type_msg_map.items():
-    if msg_type % 2 == 0 and msg_type >= 0:
-        rsp_type = msg_type + 1
-        if rsp_type in module.type_msg_map:
-            module.req_rsp_map[msg] = module.type_msg_map[rsp_type]
-
 # Calculate transport overhead
 module.TRANSPORT_OVERHEAD = get_msg_size(module.TransportHeader) + get_msg_size(module.TransportFooter)
 module.HEADER_SIZE = get_msg_size(module.TransportHeader)
@@ -281,7 +340,7 @@ if __name__ == '__main__':
     pprint(msg_packing_format_map)
 
     print("\n=== Request-Response Map ===")
-    pprint(req_rsp_map)
+    pprint({msg: response_class(msg) for msg in type_msg_map.values() if response_class(msg)})
 
     print("\n=== Message Details ===")
     for msg_type, msg in sorted(type_msg_map.items()):
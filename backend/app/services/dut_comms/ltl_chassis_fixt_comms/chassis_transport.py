@@ -9,21 +9,21 @@ Implements three-layer frame detection: Sync + Length + CRC.
 
 import asyncio
 import logging
-from collections import deque
+import struct
+import sys
 from typing import Tuple, Optional
-from io import BytesIO
 
 import serial_asyncio
 
-from .crc16_kermit import CRC16Kermit
+from .crc16_kermit import crc16_kermit
 from .chassis_msgs import (
     TransportHeader,
     TransportFooter,
     LittleChassisTestMessage,
-    get_msg_size,
-    serialize,
-    deserialize,
+    pack_into,
+    deserialize_from,
     type_msg_map,
+    msg_struct_map,
     SYNC_WORD,
     TRANSPORT_OVERHEAD,
     HEADER_SIZE,
@@ -41,6 +41,16 @@ BYTESIZE = 8
 STOPBITS = 1
 TIMEOUT = 1.0
 
+# Maximum bytes requested from the serial reader per await
+RX_CHUNK_SIZE = 4096
+
+# Sync word as it appears on the wire (big-endian)
+SYNC_BYTES = struct.pack('!I', SYNC_WORD)
+
+# Compiled transport framing, packed straight into the outgoing frame
+_HEADER_STRUCT = msg_struct_map[TransportHeader]
+_FOOTER_STRUCT = msg_struct_map[TransportFooter]
+
 
 class ChassisTransportError(Exception):
     """Base exception for chassis transport errors"""
@@ -95,6 +105,8 @@ class ChassisTransport:
         self.timeout = timeout
         self.reader: Optional[asyncio.StreamReader] = None
         self.writer: Optional[asyncio.StreamWriter] = None
+        # Received bytes not yet consumed; may hold the start of the next frame
+        self._rx_buffer = bytearray()
 
     async def __aenter__(self):
         """Async context manager entry"""
@@ -115,7 +127,15 @@ class ChassisTransport:
                 parity=PARITY,
                 stopbits=STOPBITS,
             )
-            logger.info(f"Connected to chassis fixture at {self.port}")
+            logger.info("Connected to chassis fixture at %s", self.port)
+            # Fixture replies are read back per command; drop the USB-serial
+            # adapter's 16 ms latency timer to 1 ms on Linux
+            serial_port = getattr(self.writer.transport, 'serial', None)
+            if serial_port is not None and sys.platform.startswith('linux'):
+                try:
+                    serial_port.set_low_latency_mode(True)
+                except (AttributeError, ValueError) as e:
+                    logger.debug("Low-latency mode not available on %s: %s", self.port, e)
             # Wait for device to stabilize
             await asyncio.sleep(0.5)
         except Exception as e:
@@ -128,7 +148,7 @@ class ChassisTransport:
             await self.writer.wait_closed()
             self.reader = None
             self.writer = None
-            logger.info(f"Closed connection to {self.port}")
+            logger.info("Closed connection to %s", self.port)
 
     async def send_msg(self, msg_inst: LittleChassisTestMessage):
         """
@@ -143,35 +163,20 @@ class ChassisTransport:
         if not self.writer:
             raise ChassisTransportError("Connection not open")
 
-        # Build message
-        buff = BytesIO()
-
-        # Create header
-        new_header = TransportHeader()
-        new_header.sync_word = SYNC_WORD
-        new_header.msg_type = msg_inst.msg_type
-        new_header.length = get_msg_size(msg_inst) + TRANSPORT_OVERHEAD
-
-        # Write header and body
-        header_bytes = serialize(new_header)
-        body_bytes = serialize(msg_inst)
-        buff.write(header_bytes)
-        buff.write(body_bytes)
+        # One buffer per frame: header, body and footer are packed in place and
+        # the buffer itself goes to the writer, so nothing is copied
+        frame_length = msg_inst._size + TRANSPORT_OVERHEAD
+        frame = bytearray(frame_length)
+        _HEADER_STRUCT.pack_into(frame, 0, SYNC_WORD, frame_length, msg_inst.msg_type)
+        body_end = pack_into(msg_inst, frame, HEADER_SIZE)
 
         # Calculate CRC16Kermit over header + body
-        crc16 = CRC16Kermit()
-        crc = crc16.calculate(buff.getvalue())
-
-        # Create footer
-        new_footer = TransportFooter()
-        new_footer.crc16 = crc
-        footer_bytes = serialize(new_footer)
-        buff.write(footer_bytes)
-
-        # Send complete frame
-        msg_bytes = buff.getvalue()
-        logger.debug(f"Sending: {' '.join(f'{b:02X}' for b in msg_bytes)}")
-        self.writer.write(msg_bytes)
+        crc = crc16_kermit(memoryview(frame)[:body_end])
+        _FOOTER_STRUCT.pack_into(frame, body_end, crc)
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Sending: %s", frame.hex(' ').upper())
+        self.writer.write(frame)
         await self.writer.drain()
 
     async def get_msg(self) -> Tuple[TransportHeader, LittleChassisTestMessage, TransportFooter]:
@@ -187,68 +192,82 @@ class ChassisTransport:
             Tuple of (header, message, footer)
 
         Raises:
-            ChassisTransportError: If connection is not open
+            ChassisTransportError: If connection is not open or closes mid-frame
             ChassisTimeoutError: If timeout occurs during receive
             ChassisCRCError: If CRC verification fails
         """
         if not self.reader:
             raise ChassisTransportError("Connection not open")
 
-        # Frame detection using sliding window
-        frame_detector = deque(b'\xff' * HEADER_SIZE, maxlen=HEADER_SIZE)
+        rx = self._rx_buffer
+        frame_length = 0
 
         try:
             while True:
-                # Read one byte with timeout
+                # Locate the sync word with a C-level scan over everything buffered
+                index = rx.find(SYNC_BYTES)
+                if index < 0:
+                    # Keep a possible partial sync word at the end
+                    del rx[:max(0, len(rx) - (len(SYNC_BYTES) - 1))]
+                else:
+                    del rx[:index]
+                    if len(rx) >= HEADER_SIZE:
+                        # Only the length is needed until the whole frame is in
+                        _, frame_length, _ = _HEADER_STRUCT.unpack_from(rx)
+                        if frame_length < TRANSPORT_OVERHEAD:
+                            # False sync inside noise; resume scanning after it
+                            logger.debug("Discarding sync with invalid length %s", frame_length)
+                            frame_length = 0
+                            del rx[:1]
+                            continue
+                        if len(rx) >= frame_length:
+                            break
+
+                # Read whatever has arrived, up to RX_CHUNK_SIZE bytes
                 try:
-                    input_byte = await asyncio.wait_for(
-                        self.reader.read(1),
+                    chunk = await asyncio.wait_for(
+                        self.reader.read(RX_CHUNK_SIZE),
                         timeout=self.timeout
                     )
                 except asyncio.TimeoutError:
-                    raise ChassisTimeoutError(f"Timeout waiting for sync word")
-
-                if not input_byte:
-                    continue
-
-                frame_detector.append(input_byte)
-                logger.debug(f"Byte: {input_byte.hex().upper()}")
-
-                # Try to deserialize header
-                header_bytes = b''.join(frame_detector)
-                header = deserialize(TransportHeader, header_bytes)
-
-                # Check sync word
-                if header.sync_word == SYNC_WORD:
-                    logger.debug(f"Sync detected, length={header.length}, msg_type=0x{header.msg_type:02X}")
-                    break
-
-            # Read body
-            body_length = header.length - TRANSPORT_OVERHEAD
-            body = await asyncio.wait_for(
-                self.reader.read(body_length),
-                timeout=self.timeout
-            )
+                    if frame_length:
+                        raise ChassisTimeoutError("Timeout during message receive")
+                    raise ChassisTimeoutError("Timeout waiting for sync word")
+
+                if not chunk:
+                    raise ChassisTransportError("Connection closed by chassis fixture")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Read: %s", chunk.hex(' ').upper())
+                rx += chunk
+
+            # Parse the frame in place at the front of the receive buffer, then
+            # drop it; trailing bytes stay for the next call
+            body_end = frame_length - FOOTER_SIZE
+            try:
+                header = deserialize_from(TransportHeader, rx)
+                logger.debug("Sync detected, length=%s, msg_type=0x%02X", header.length, header.msg_type)
+                footer = deserialize_from(TransportFooter, rx, body_end)
+
+                # Verify CRC
+                with memoryview(rx) as view:
+                    calculated_crc = crc16_kermit(view[:body_end])
+                if calculated_crc != footer.crc16:
+                    raise ChassisCRCError(
+                        f"CRC mismatch: expected 0x{footer.crc16:04X}, "
+                        f"calculated 0x{calculated_crc:04X}"
+                    )
 
-            # Read footer
-            footer_bytes = await asyncio.wait_for(
-                self.reader.read(FOOTER_SIZE),
-                timeout=self.timeout
-            )
-            footer = deserialize(TransportFooter, footer_bytes)
-
-            # Verify CRC
-            crc16 = CRC16Kermit()
-            calculated_crc = crc16.calculate(header_bytes + body)
-            if calculated_crc != footer.crc16:
-                raise ChassisCRCError(
-                    f"CRC mismatch: expected 0x{footer.crc16:04X}, "
-                    f"calculated 0x{calculated_crc:04X}"
-                )
-
-            # Deserialize message body
-            msg = deserialize(type_msg_map[header.msg_type], body)
-            logger.debug(f"Received: {msg}")
+                # Deserialize message body
+                msg_class = type_msg_map[header.msg_type]
+                if msg_class._size != body_end - HEADER_SIZE:
+                    raise ChassisTransportError(
+                        f"Body length {body_end - HEADER_SIZE} does not match "
+                        f"{msg_class.__name__} ({msg_class._size} bytes)"
+                    )
+                msg = deserialize_from(msg_class, rx, HEADER_SIZE)
+            finally:
+                del rx[:frame_length]
+            logger.debug("Received: %s", msg)
 
             return header, msg, footer
 
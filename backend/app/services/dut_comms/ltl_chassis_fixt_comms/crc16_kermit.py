@@ -11,6 +11,54 @@ Reflect output: True
 Refactored to replace PyCRC.CRC16Kermit dependency.
 """
 
+import binascii
+
+
+def _make_table() -> tuple:
+    """Generate CRC lookup table for reflected algorithm"""
+    table = []
+    for i in range(256):
+        crc = i
+        for _ in range(8):
+            if crc & 1:
+                crc = (crc >> 1) ^ 0x8408  # Reflected polynomial
+            else:
+                crc >>= 1
+        table.append(crc)
+    return tuple(table)
+
+
+# Built once at import; exposed as CRC16Kermit.table
+_KERMIT_TABLE = _make_table()
+
+# Each byte value with its bit order reversed (translate() table)
+_REFLECT_BYTE = bytes(int(f'{i:08b}'[::-1], 2) for i in range(256))
+
+
+def crc16_kermit(data: bytes) -> int:
+    """
+    Calculate CRC16-Kermit checksum.
+
+    Kermit is CRC-CCITT with reflected input and output, so the work is done
+    in C: the input bytes are bit-reversed with bytes.translate, run through
+    binascii.crc_hqx (non-reflected CCITT, init 0), and the 16-bit result is
+    bit-reversed back. No Python-level loop runs per byte.
+
+    Args:
+        data: Input bytes (any bytes-like object) to calculate CRC over
+
+    Returns:
+        16-bit CRC value
+
+    Example:
+        >>> hex(crc16_kermit(b'123456789'))
+        '0x2189'
+    """
+    if not isinstance(data, (bytes, bytearray)):
+        data = bytes(data)
+    crc = binascii.crc_hqx(data.translate(_REFLECT_BYTE), 0)
+    return (_REFLECT_BYTE[crc & 0xFF] << 8) | _REFLECT_BYTE[crc >> 8]
+
 
 class CRC16Kermit:
     """
@@ -24,20 +72,7 @@ class CRC16Kermit:
         self.polynomial = 0x1021
         self.initial_value = 0x0000
         self.final_xor = 0x0000
-        self.table = self._make_table()
-
-    def _make_table(self) -> list:
-        """Generate CRC lookup table for reflected algorithm"""
-        table = []
-        for i in range(256):
-            crc = i
-            for _ in range(8):
-                if crc & 1:
-                    crc = (crc >> 1) ^ 0x8408  # Reflected polynomial
-                else:
-                    crc >>= 1
-            table.append(crc)
-        return table
+        self.table = _KERMIT_TABLE
 
     def calculate(self, data: bytes) -> int:
         """
@@ -55,13 +90,7 @@ class CRC16Kermit:
             >>> hex(checksum)
             '0x2189'
         """
-        crc = self.initial_value
-
-        for byte in data:
-            table_index = (crc ^ byte) & 0xFF
-            crc = (crc >> 8) ^ self.table[table_index]
-
-        return crc & 0xFFFF
+        return crc16_kermit(data)
 
 
 # Test vectors
@@ -4,6 +4,9 @@ Manages relay switching for device testing
 """
 import asyncio
 import logging
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Dict, Any
 from enum import IntEnum
 import serial
@@ -12,6 +15,12 @@ import serial.tools.list_ports
 logger = logging.getLogger(__name__)
 
 
+DEFAULT_RELAY_DEVICE = "/dev/ttyUSB0"
+
+# Arduino bootloader reset time after the port is opened (PDTool4 pattern)
+ARDUINO_RESET_DELAY = 2.0
+
+
 class RelayState(IntEnum):
     """Relay state constants matching PDTool4"""
     SWITCH_OPEN = 0   # ON state
@@ -24,6 +33,13 @@ class RelayController:
     Maps to PDTool4's MeasureSwitchON/OFF functionality.
     """
 
+    # Pre-encoded "<channel> <o|f> " commands for channels 1-16
+    _CMD_CACHE = {
+        (channel, state): f"{channel} {'o' if state == RelayState.SWITCH_OPEN else 'f'} ".encode('ascii')
+        for channel in range(1, 17)
+        for state in RelayState
+    }
+
     def __init__(self, device_path: Optional[str] = None, config: Optional[Dict[str, Any]] = None):
         """
         Initialize relay controller.
@@ -32,12 +48,22 @@ class RelayController:
             device_path: Path to relay control device (e.g., '/dev/ttyUSB0')
             config: Additional configuration parameters
         """
-        self.device_path = device_path or "/dev/ttyUSB0"
+        self.device_path = device_path or DEFAULT_RELAY_DEVICE
         self.config = config or {}
         self.logger = logging.getLogger(self.__class__.__name__)
         self._current_state: Optional[RelayState] = None
         self._baud_rate = self.config.get("baud_rate", 115200)  # Default from PDTool4
         self._timeout = self.config.get("timeout", 1.0)
+        # Optional line the firmware prints once booted; lets the open return
+        # as soon as it is seen instead of always waiting ARDUINO_RESET_DELAY
+        self._ready_banner: Optional[str] = self.config.get("ready_banner")
+        # Serial port is opened on first use and kept open between commands,
+        # so the Arduino reset wait is paid once instead of per switch
+        self._ser: Optional[serial.Serial] = None
+        self._open_lock = asyncio.Lock()
+        # All pyserial calls go through one dedicated thread: commands reach the
+        # Arduino in FIFO order and never wait behind the shared default pool
+        self._executor: Optional[ThreadPoolExecutor] = None
 
     async def set_relay_state(self, state: RelayState, channel: int = 1) -> bool:
         """
@@ -51,7 +77,8 @@ class RelayController:
             True if successful, False otherwise
         """
         try:
-            state_name = "OPEN" if state == RelayState.SWITCH_OPEN else "CLOSED"
+            # Plain int compare; SWITCH_OPEN is 0 (avoids IntEnum.__eq__)
+            state_name = "CLOSED" if int(state) else "OPEN"
             self.logger.info(f"Setting relay channel {channel} to {state_name} (state={state})")
 
             # TODO: Implement actual relay control via serial port or other interface
@@ -86,70 +113,131 @@ class RelayController:
             True if command sent successfully
         """
         try:
-            # Build command string
             # Format: "<channel> <state>" where state is 'o' (on/open) or 'f' (off/closed)
-            state_char = 'o' if state == RelayState.SWITCH_OPEN else 'f'
-            command = f"{channel} {state_char} "
+            command = self._CMD_CACHE.get((channel, state))
+            if command is None:
+                # Channel outside 1-16: build it on the fly
+                state_char = 'f' if int(state) else 'o'
+                command = f"{channel} {state_char} ".encode('ascii')
+
+            self.logger.debug("Sending relay command: %r to %s", command, self.device_path)
+
+            async with self._open_lock:
+                try:
+                    await self._ensure_open()
+                    await self._run_io(self._write_sync, command)
+                except serial.SerialException as e:
+                    self.logger.error(f"Serial communication error: {e}")
+                    # Forget the handle so the next command reopens the port
+                    await self._close_port()
+                    return False
 
-            self.logger.debug(f"Sending relay command: '{command}' to {self.device_path}")
-
-            # Open serial port and send command
-            # Using synchronous serial in thread to avoid blocking
-            loop = asyncio.get_event_loop()
-            success = await loop.run_in_executor(
-                None,
-                self._send_serial_sync,
-                command
-            )
-
-            return success
+            return True
 
         except Exception as e:
             self.logger.error(f"Error sending relay command: {e}", exc_info=True)
             return False
 
-    def _send_serial_sync(self, command: str) -> bool:
+    async def _ensure_open(self) -> None:
+        """
+        Open the serial port if it is not already open.
+
+        Must be called with _open_lock held.
+        """
+        if self._ser is None or not self._ser.is_open:
+            self._ser = await self._run_io(self._open_sync)
+
+    def _run_io(self, func, *args) -> asyncio.Future:
+        """Run a blocking serial call on the controller's I/O thread."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="relay-io")
+        return asyncio.wrap_future(self._executor.submit(func, *args))
+
+    def _open_sync(self) -> serial.Serial:
+        """
+        Open the serial port and wait for the Arduino to reset (runs in executor).
+
+        Returns:
+            Open serial.Serial handle
+        """
+        ser = serial.Serial(
+            port=self.device_path,
+            baudrate=self._baud_rate,
+            bytesize=serial.EIGHTBITS,
+            parity=serial.PARITY_NONE,
+            stopbits=serial.STOPBITS_ONE,
+            timeout=self._timeout
+        )
+        # USB-serial adapters hold RX bytes for a 16 ms latency timer by
+        # default; ASYNC_LOW_LATENCY drops it to 1 ms on Linux
+        if sys.platform.startswith('linux'):
+            try:
+                ser.set_low_latency_mode(True)
+            except (AttributeError, ValueError) as e:
+                self.logger.debug("Low-latency mode not available on %s: %s", self.device_path, e)
+
+        # Opening the port resets the Arduino; wait for it to initialize (PDTool4 pattern)
+        if self._ready_banner:
+            self._wait_for_ready(ser, self._ready_banner.encode('ascii'))
+        else:
+            time.sleep(ARDUINO_RESET_DELAY)
+        self.logger.info(f"Opened relay serial port {self.device_path}")
+        return ser
+
+    def _wait_for_ready(self, ser: serial.Serial, banner: bytes) -> bool:
         """
-        Synchronous serial communication (runs in executor).
+        Wait for the firmware's ready banner after reset (runs in executor).
 
         Args:
-            command: Command string to send
+            ser: Freshly opened serial handle
+            banner: Bytes the firmware prints once booted
 
         Returns:
-            True if successful
+            True if the banner arrived before ARDUINO_RESET_DELAY elapsed
         """
-        ser = None
-        try:
-            # Open serial port
-            ser = serial.Serial(
-                port=self.device_path,
-                baudrate=self._baud_rate,
-                bytesize=serial.EIGHTBITS,
-                parity=serial.PARITY_NONE,
-                stopbits=serial.STOPBITS_ONE,
-                timeout=self._timeout
-            )
-
-            # Wait for Arduino to initialize (PDTool4 pattern)
-            import time
-            time.sleep(2)
-
-            # Send command
-            ser.write(command.encode('utf-8'))
-            ser.flush()
-
-            self.logger.info(f"Serial command sent successfully: {command.strip()}")
-            return True
+        received = bytearray()
+        deadline = time.monotonic() + ARDUINO_RESET_DELAY
+        while time.monotonic() < deadline:
+            waiting = ser.in_waiting
+            if waiting:
+                received += ser.read(waiting)
+                if banner in received:
+                    return True
+            else:
+                time.sleep(0.01)
+        self.logger.warning(
+            f"No ready banner {banner!r} from {self.device_path} "
+            f"within {ARDUINO_RESET_DELAY}s; continuing"
+        )
+        return False
+
+    def _write_sync(self, command: bytes) -> None:
+        """
+        Write a command to the open serial port (runs in executor).
 
-        except serial.SerialException as e:
-            self.logger.error(f"Serial communication error: {e}")
-            return False
-        except Exception as e:
-            self.logger.error(f"Unexpected error in serial communication: {e}", exc_info=True)
-            return False
-        finally:
-            if ser and ser.is_open:
-                ser.close()
+        Args:
+            command: Encoded command to send
+        """
+        self._ser.write(command)
+        self._ser.flush()
+        self.logger.debug("Serial command sent successfully: %r", command)
+
+    async def _close_port(self) -> None:
+        """Close and forget the serial handle. Caller holds _open_lock."""
+        ser, self._ser = self._ser, None
+        if ser is not None:
+            try:
+                await self._run_io(ser.close)
+            except Exception as e:
+                self.logger.warning(f"Error closing relay serial port: {e}")
+
+    async def close(self) -> None:
+        """Close the cached serial port, if open, and stop the I/O thread."""
+        async with self._open_lock:
+            await self._close_port()
+            executor, self._executor = self._executor, None
+            if executor is not None:
+                executor.shutdown(wait=False)
 
     async def switch_on(self, channel: int = 1) -> bool:
         """
@@ -200,8 +288,8 @@ class RelayController:
         return await self.switch_off(channel)
 
 
-# Global relay controller instance
-_relay_controller_instance: Optional[RelayController] = None
+# Shared controllers by device path (each owns its serial port); closed on shutdown
+_relay_controllers: Dict[str, RelayController] = {}
 
 
 def get_relay_controller(
@@ -209,7 +297,11 @@ def get_relay_controller(
     config: Optional[Dict[str, Any]] = None
 ) -> RelayController:
     """
-    Get or create global relay controller instance.
+    Get or create the shared relay controller for a device.
+
+    There is one controller per device path, so only one object ever owns
+    the device's serial handle. config only applies when the controller for
+    that device is first created.
 
     Args:
         device_path: Device path for relay control
@@ -218,9 +310,15 @@ def get_relay_controller(
     Returns:
         RelayController instance
     """
-    global _relay_controller_instance
-
-    if _relay_controller_instance is None:
-        _relay_controller_instance = RelayController(device_path, config)
-
-    return _relay_controller_instance
+    device_path = device_path or DEFAULT_RELAY_DEVICE
+    controller = _relay_controllers.get(device_path)
+    if controller is None:
+        controller = RelayController(device_path, config)
+        _relay_controllers[device_path] = controller
+    return controller
+
+
+async def close_relay_controller() -> None:
+    """Close the shared relay controllers' serial ports on shutdown."""
+    for controller in _relay_controllers.values():
+        await controller.close()
@@ -18,7 +18,10 @@ Default endpoints:
 """
 from .vcu_common import (
     get_udp_sock,
+    connect_udp_sock,
     flush_udp_recv,
+    send_framed,
+    send_framed_cached,
     VCU_DEFAULT_IP,
     VCU_TEST_PORT,
     VCU_CONNECT_PORT,
@@ -31,8 +34,10 @@ from .header import (
     MESSAGE_FORMAT_BARE_NANO_PB,
     MESSAGE_FORMAT_C_STRUCT,
     MAX_MESSAGE_BODY_LENGTH,
+    HEADER_SIZE,
     COMM_MSG_OK,
     create_header,
+    build_header_bytes,
     calculate_crc,
 )
 from .vcu_ether_link import (
@@ -45,7 +50,10 @@ from .vcu_ether_link import (
 
 __all__ = [
     'get_udp_sock',
+    'connect_udp_sock',
     'flush_udp_recv',
+    'send_framed',
+    'send_framed_cached',
     'VCU_DEFAULT_IP',
     'VCU_TEST_PORT',
     'VCU_CONNECT_PORT',
@@ -56,8 +64,10 @@ __all__ = [
     'MESSAGE_FORMAT_BARE_NANO_PB',
     'MESSAGE_FORMAT_C_STRUCT',
     'MAX_MESSAGE_BODY_LENGTH',
+    'HEADER_SIZE',
     'COMM_MSG_OK',
     'create_header',
+    'build_header_bytes',
     'calculate_crc',
     'VcuTestInterface',
     'VcuConnectFailed',
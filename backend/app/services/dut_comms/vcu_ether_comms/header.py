@@ -13,8 +13,9 @@ Message Header Format (12 bytes):
 
 The CRC32 covers everything from offset 8 onwards (message_format + body).
 """
-from collections import OrderedDict
 import ctypes
+import struct
+import zlib
 from app.services.dut_comms.common.struct_message import StructMessage
 
 
@@ -30,6 +31,20 @@ COMM_MSG_GENERAL_ERROR = 2
 COMM_MSG_EEPROM_DATA_CRC_FAILED = 3
 COMM_MSG_EEPROM_READ_FAILED = 4
 
+# Header fields covered by the CRC (message_format, reserved), compiled once
+CRC_OFFSET = 8
+_CRC_HEADER_TAIL = struct.Struct("<HH")
+
+# CRC32 of the header tail for the known formats (reserved=0), used as the
+# seed for the body CRC; keyed by (message_format, reserved) and by the packed tail
+_HEADER_CRC_SEEDS = {
+    (fmt, 0): zlib.crc32(_CRC_HEADER_TAIL.pack(fmt, 0)) & 0xFFFFFFFF
+    for fmt in (MESSAGE_FORMAT_BARE_NANO_PB, MESSAGE_FORMAT_C_STRUCT)
+}
+_HEADER_CRC_SEEDS_BY_TAIL = {
+    _CRC_HEADER_TAIL.pack(*key): seed for key, seed in _HEADER_CRC_SEEDS.items()
+}
+
 
 class CommMsgHeader_t(StructMessage):
     """
@@ -37,25 +52,33 @@ class CommMsgHeader_t(StructMessage):
 
     12-byte header with sync, length, CRC, and format information.
     """
-    fields = OrderedDict([
-        ("sync", ctypes.c_uint16),         # 0xCAFE sync word
-        ("length", ctypes.c_uint16),       # Message body length
-        ("crc", ctypes.c_uint32),          # CRC32 checksum
-        ("message_format", ctypes.c_uint16),  # Message format (1=Protobuf, 3=C struct)
-        ("reserved", ctypes.c_uint16),     # Reserved for future use
-    ])
+    fields = {
+        "sync": ctypes.c_uint16,         # 0xCAFE sync word
+        "length": ctypes.c_uint16,       # Message body length
+        "crc": ctypes.c_uint32,          # CRC32 checksum
+        "message_format": ctypes.c_uint16,  # Message format (1=Protobuf, 3=C struct)
+        "reserved": ctypes.c_uint16,     # Reserved for future use
+    }
     pack_str = "<HHIHH"
 
+    def __init__(self):
+        super().__init__()
+        # Keep length an int even before deserialize, for is_valid_length
+        self.length = 0
+
     def is_valid(self) -> bool:
         """Check if header has valid sync word."""
         return self.sync == MAGIC_SYNC_U16
 
     def is_valid_length(self) -> bool:
         """Check if length is within valid range."""
-        try:
-            return self.length is not None and 0 < self.length <= MAX_MESSAGE_BODY_LENGTH
-        except (TypeError, AttributeError):
-            return False
+        return 0 < self.length <= MAX_MESSAGE_BODY_LENGTH
+
+
+# Whole header layout: the Struct StructMessage compiled for CommMsgHeader_t,
+# reused for packing outbound headers without building an instance
+_HEADER_STRUCT = CommMsgHeader_t._struct
+HEADER_SIZE = CommMsgHeader_t._size
 
 
 def create_header(body: bytes, message_format: int = MESSAGE_FORMAT_BARE_NANO_PB) -> CommMsgHeader_t:
@@ -69,29 +92,45 @@ def create_header(body: bytes, message_format: int = MESSAGE_FORMAT_BARE_NANO_PB
     Returns:
         CommMsgHeader_t: Created header with calculated CRC
     """
-    import zlib
-    import struct
-
     header = CommMsgHeader_t()
     header.sync = MAGIC_SYNC_U16
     header.length = len(body)
     header.message_format = message_format
     header.reserved = 0
 
-    # Calculate CRC (covers offset 8+)
-    CRC_OFFSET = 8
-    header_str = struct.pack("<HHIHH",
-        header.sync, header.length, 0,  # CRC placeholder
-        header.message_format, header.reserved
-    )
-    trimmed_header_str = header_str[CRC_OFFSET:]
-    header_crc_part = zlib.crc32(trimmed_header_str) & 0xFFFFFFFF
-    crc = zlib.crc32(body, header_crc_part) & 0xFFFFFFFF
-    header.crc = crc
+    # Calculate CRC (covers offset 8+, i.e. message_format and reserved)
+    header.crc = _body_crc(body, message_format)
 
     return header
 
 
+def build_header_bytes(body: bytes, message_format: int = MESSAGE_FORMAT_BARE_NANO_PB) -> bytes:
+    """
+    Build the serialized header for a message body in a single pack.
+
+    Equivalent to create_header(body, message_format).serialize(), without
+    creating a CommMsgHeader_t; used on the send path.
+
+    Args:
+        body: Serialized message body
+        message_format: Message format type (default: Protocol Buffers)
+
+    Returns:
+        bytes: 12-byte header with calculated CRC
+    """
+    crc = _body_crc(body, message_format)
+    return _HEADER_STRUCT.pack(MAGIC_SYNC_U16, len(body), crc, message_format, 0)
+
+
+def _body_crc(body: bytes, message_format: int) -> int:
+    """CRC32 over the header tail (message_format, reserved=0) and body."""
+    header_crc_part = _HEADER_CRC_SEEDS.get((message_format, 0))
+    if header_crc_part is None:
+        trimmed_header_str = _CRC_HEADER_TAIL.pack(message_format, 0)
+        header_crc_part = zlib.crc32(trimmed_header_str) & 0xFFFFFFFF
+    return zlib.crc32(body, header_crc_part) & 0xFFFFFFFF
+
+
 def calculate_crc(header_str: bytes, body_str: bytes) -> int:
     """
     Calculate CRC32 checksum for VCU protocol.
@@ -103,10 +142,9 @@ def calculate_crc(header_str: bytes, body_str: bytes) -> int:
     Returns:
         int: CRC32 checksum
     """
-    import zlib
-
-    CRC_OFFSET = 8
     trimmed_header_str = header_str[CRC_OFFSET:]
-    header_crc_part = zlib.crc32(trimmed_header_str) & 0xFFFFFFFF
+    header_crc_part = _HEADER_CRC_SEEDS_BY_TAIL.get(trimmed_header_str)
+    if header_crc_part is None:
+        header_crc_part = zlib.crc32(trimmed_header_str) & 0xFFFFFFFF
     crc = zlib.crc32(body_str, header_crc_part) & 0xFFFFFFFF
     return crc
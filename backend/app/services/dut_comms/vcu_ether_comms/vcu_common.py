@@ -5,18 +5,65 @@ Provides UDP socket creation and buffer management utilities.
 Refactored from PDTool4 polish/dut_comms/vcu_ether_comms/vcu_common.py (17 lines).
 """
 import socket
-import asyncio
+from functools import lru_cache
 from typing import Optional
 
+from .header import MESSAGE_FORMAT_BARE_NANO_PB, build_header_bytes
+
+
+# Socket buffer sizes for frame-rate VCU polling (the kernel may cap these
+# at net.core.rmem_max / wmem_max)
+UDP_RCVBUF_SIZE = 4 << 20
+UDP_SNDBUF_SIZE = 1 << 20
+
+# Linux can create the socket non-blocking directly; elsewhere fall back to setblocking()
+_SOCK_NONBLOCK = getattr(socket, 'SOCK_NONBLOCK', 0)
+
+# Per-call non-blocking recv (POSIX); not available on Windows
+_MSG_DONTWAIT = getattr(socket, 'MSG_DONTWAIT', 0)
+
+# Discarded datagrams land here; contents are never read, so sharing is safe
+_FLUSH_SCRATCH = bytearray(2**16)
+
 
 def get_udp_sock() -> socket.socket:
     """
     Create and configure a UDP socket.
 
+    The socket is non-blocking from creation, so loop.sock_recv() callers
+    need no separate setblocking(False); receive timeouts belong in
+    asyncio.wait_for, not settimeout().
+
     Returns:
         socket.socket: Configured UDP socket
     """
-    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM | _SOCK_NONBLOCK)
+    if not _SOCK_NONBLOCK:
+        sock.setblocking(False)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, UDP_RCVBUF_SIZE)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, UDP_SNDBUF_SIZE)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    return sock
+
+
+def connect_udp_sock(sock: socket.socket, endpoint: tuple) -> socket.socket:
+    """
+    Fix a UDP socket's peer so it can use send()/recv() without an address.
+
+    The kernel keeps the destination in socket state, so each send skips
+    the address parsing and route lookup sendto() does per datagram. The
+    socket also only receives datagrams from that peer, and an ICMP port
+    unreachable from it is raised by the next send/recv as
+    ConnectionRefusedError.
+
+    Args:
+        sock: UDP socket (e.g. from get_udp_sock())
+        endpoint: (host, port) peer; resolve first (create_udp_endpoint)
+
+    Returns:
+        socket.socket: The same socket, now connected
+    """
+    sock.connect(endpoint)
     return sock
 
 
@@ -30,70 +77,130 @@ def flush_udp_recv(sock: socket.socket, byte_size_to_flush: int = 2**16) -> None
         sock: Socket to flush
         byte_size_to_flush: Maximum bytes to flush (default 65536)
     """
+    # A timed socket polls for its whole timeout before recv(), so MSG_DONTWAIT
+    # alone cannot help there; switch it to non-blocking for the drain. Fully
+    # blocking sockets (timeout None) only need that without MSG_DONTWAIT.
+    timeout = sock.gettimeout()
+    switch_mode = timeout != 0.0 and (timeout is not None or not _MSG_DONTWAIT)
+    nbytes = min(byte_size_to_flush, len(_FLUSH_SCRATCH))
     try:
-        # Set very short timeout
-        timeout = sock.gettimeout()
-        sock.settimeout(0.0001)
-
-        try:
-            # Read and discard all available data
-            while True:
-                trash = sock.recv(byte_size_to_flush)
-                if not trash:
-                    break
-        except socket.timeout:
-            # Expected - no more data
+        if switch_mode:
+            sock.setblocking(False)
+        # Read and discard all queued datagrams into the scratch buffer; never waits
+        while sock.recv_into(_FLUSH_SCRATCH, nbytes, _MSG_DONTWAIT):
             pass
-        finally:
-            # Restore original timeout
-            sock.settimeout(timeout)
-
-    except Exception:
+    except (BlockingIOError, InterruptedError):
+        # Expected - no more data
+        pass
+    except OSError:
         # Ignore errors during flush
         pass
+    finally:
+        if switch_mode:
+            sock.settimeout(timeout)
 
 
 async def async_flush_udp_recv(sock: socket.socket) -> None:
     """
     Async version of UDP socket buffer flushing.
 
+    Draining only reads datagrams already queued, so it never waits and can
+    run inline; the socket's blocking mode is left as it was.
+
     Args:
         sock: Socket to flush
     """
-    try:
-        loop = asyncio.get_event_loop()
-        sock.settimeout(0.0001)
-
-        try:
-            while True:
-                # Use loop.sock_recv for async operation
-                data = await asyncio.wait_for(
-                    loop.sock_recv(sock, 65536),
-                    timeout=0.001
-                )
-                if not data:
-                    break
-        except (asyncio.TimeoutError, socket.timeout):
-            pass
-        finally:
-            sock.settimeout(None)  # Reset to blocking
+    flush_udp_recv(sock)
+
+
+def send_framed(
+    sock: socket.socket,
+    body: bytes,
+    endpoint: Optional[tuple] = None,
+    message_format: int = MESSAGE_FORMAT_BARE_NANO_PB,
+) -> int:
+    """
+    Send a message body with its VCU header as a single datagram.
+
+    Header and body are handed to sendmsg() as separate buffers (gather
+    write), so they are never concatenated in Python. Platforms without
+    sendmsg (Windows) fall back to sendto(header + body).
+
+    Args:
+        sock: Socket to send on
+        body: Serialized message body
+        endpoint: (host, port) endpoint; None for a socket set up with
+            connect_udp_sock()
+        message_format: Message format type (default: Protocol Buffers)
+
+    Returns:
+        int: Number of bytes sent
+    """
+    return _send_with_header(sock, build_header_bytes(body, message_format), body, endpoint)
+
+
+@lru_cache(maxsize=64)
+def _cached_header(body: bytes, message_format: int) -> bytes:
+    """build_header_bytes, memoized per (body, message_format)."""
+    return build_header_bytes(body, message_format)
 
-    except Exception:
-        pass
+
+def send_framed_cached(
+    sock: socket.socket,
+    body: bytes,
+    endpoint: Optional[tuple] = None,
+    message_format: int = MESSAGE_FORMAT_BARE_NANO_PB,
+) -> int:
+    """
+    send_framed() for small bodies that are sent repeatedly (e.g. poll requests).
+
+    The header, and so the CRC32, is computed once per distinct body and
+    served from a 64-entry LRU cache afterwards. Bodies carrying a changing
+    field such as a timestamp never hit the cache; use send_framed() for those.
+
+    Args:
+        sock: Socket to send on
+        body: Serialized message body (bytes; must be hashable)
+        endpoint: (host, port) endpoint; None for a connected socket
+        message_format: Message format type (default: Protocol Buffers)
+
+    Returns:
+        int: Number of bytes sent
+    """
+    return _send_with_header(sock, _cached_header(body, message_format), body, endpoint)
+
+
+def _send_with_header(sock: socket.socket, header: bytes, body: bytes, endpoint: Optional[tuple]) -> int:
+    """Send header + body as one datagram, gathered by sendmsg() where available."""
+    if hasattr(sock, 'sendmsg'):
+        if endpoint is None:
+            return sock.sendmsg([header, body])
+        return sock.sendmsg([header, body], [], 0, endpoint)
+    if endpoint is None:
+        return sock.send(header + body)
+    return sock.sendto(header + body, endpoint)
 
 
 def create_udp_endpoint(host: str, port: int) -> tuple:
     """
     Create UDP endpoint tuple for socket operations.
 
+    The host is resolved once here, so sendto() gets a numeric address and
+    never calls getaddrinfo per datagram. If resolution fails (e.g. the name
+    is not resolvable yet), the unresolved (host, port) is returned and
+    sendto() resolves it on use.
+
     Args:
         host: IP address or hostname
         port: Port number
 
     Returns:
-        tuple: (host, port) endpoint tuple
+        tuple: (ip, port) endpoint tuple
     """
-    return (host, port)
+    try:
+        return socket.getaddrinfo(host, port, socket.AF_INET, socket.SOCK_DGRAM)[0][4]
+    except socket.gaierror:
+        return (host, port)
 
 
 # Default VCU endpoints
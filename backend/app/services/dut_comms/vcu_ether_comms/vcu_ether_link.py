@@ -7,7 +7,7 @@ Refactored from PDTool4 polish/dut_comms/vcu_ether_comms/vcu_ether_link.py (277
 Features:
 - Connection handshake via 'connect' string echo
 - Triple-frame detection (Sync + Length + CRC)
-- SocketBuffer for thread-safe buffered reading
+- SocketBuffer for thread-safe buffered reading and sync search
 - Protocol Buffers message support
 - Async context manager support
 
@@ -24,21 +24,18 @@ Example:
 """
 import asyncio
 import socket
-import time
 import struct
-import zlib
+import time
 import logging
-from collections import deque
 from typing import Optional, Tuple
 
 from .header import (
     CommMsgHeader_t,
     MAGIC_SYNC_U16,
     MAX_MESSAGE_BODY_LENGTH,
+    HEADER_SIZE,
     calculate_crc,
 )
-
-CRC_OFFSET = 8  # CRC covers everything from offset 8 onwards
 from .vcu_common import (
     TEST_ENDPOINT,
     CONNECT_ENDPOINT,
@@ -46,7 +43,9 @@ from .vcu_common import (
     VCU_TEST_PORT,
     VCU_CONNECT_PORT,
     get_udp_sock,
+    connect_udp_sock,
     flush_udp_recv,
+    send_framed,
 )
 
 logger = logging.getLogger(__name__)
@@ -57,6 +56,12 @@ DEFAULT_CONNECT_RETRIES = 15
 DEFAULT_TIMEOUT = 3.0
 DEFAULT_VERBOSE = False
 
+# Largest read taken from the socket per receive
+RECV_CHUNK_SIZE = 4096
+
+# Sync word as it appears on the wire (header is little-endian)
+SYNC_BYTES = struct.pack('<H', MAGIC_SYNC_U16)
+
 
 class VcuConnectFailed(Exception):
     """Raised when VCU connection handshake fails."""
@@ -82,8 +87,11 @@ class SocketBuffer:
 
     Methods:
         fill(size): Ensure at least size bytes are in buffer
+        find(needle, start): Locate needle, receiving more data if absent
         peek(size): Non-destructive read of size bytes
+        peek_at(offset, size): Non-destructive read of size bytes at offset
         read(size): Consume and return size bytes
+        discard(size): Drop size bytes from the front
     """
 
     def __init__(self, sock: socket.socket):
@@ -96,6 +104,10 @@ class SocketBuffer:
         self._buff = bytearray()
         self._sock = sock
         self._lock = asyncio.Lock()
+        # Datagrams are received straight into this scratch buffer, so no
+        # intermediate bytes object is created per read
+        self._scratch = bytearray(RECV_CHUNK_SIZE)
+        self._scratch_view = memoryview(self._scratch)
 
     async def fill(self, size: int) -> None:
         """
@@ -109,16 +121,47 @@ class SocketBuffer:
             remaining_read = size - buff_len
 
             if remaining_read > 0:
-                # Read more data from socket
-                loop = asyncio.get_event_loop()
-                try:
-                    data = await asyncio.wait_for(
-                        loop.sock_recv(self._sock, 4096),
-                        timeout=DEFAULT_TIMEOUT
-                    )
-                    self._buff.extend(data)
-                except asyncio.TimeoutError:
-                    pass  # No more data available
+                await self._recv_more()
+
+    async def _recv_more(self) -> bool:
+        """
+        Append one read from the socket to the buffer (caller holds the lock).
+
+        Returns:
+            bool: True if any data was received before DEFAULT_TIMEOUT
+        """
+        loop = asyncio.get_running_loop()
+        try:
+            nbytes = await asyncio.wait_for(
+                loop.sock_recv_into(self._sock, self._scratch_view),
+                timeout=DEFAULT_TIMEOUT
+            )
+        except (asyncio.TimeoutError, ConnectionRefusedError):
+            # No more data available; on a connected socket an ICMP port
+            # unreachable is reported once, like a read that timed out
+            return False
+        self._buff += self._scratch_view[:nbytes]
+        return nbytes > 0
+
+    async def find(self, needle: bytes, start: int = 0) -> int:
+        """
+        Find needle in the buffer, receiving once more if it is not there yet.
+
+        The search is bytearray.find over everything buffered, so no
+        per-byte Python code runs while scanning for a sync word.
+
+        Args:
+            needle: Bytes to search for
+            start: Buffer offset to start searching at
+
+        Returns:
+            int: Offset of needle, or -1 if still not found
+        """
+        async with self._lock:
+            index = self._buff.find(needle, start)
+            if index < 0 and await self._recv_more():
+                index = self._buff.find(needle, start)
+            return index
 
     async def peek(self, size: int) -> bytes:
         """
@@ -131,7 +174,26 @@ class SocketBuffer:
             bytes: First size bytes from buffer (without removing)
         """
         await self.fill(size)
-        return bytes(self._buff[:size])
+        return self._copy_out(0, size)
+
+    async def peek_at(self, offset: int, size: int) -> bytes:
+        """
+        Non-destructive read of size bytes starting at offset.
+
+        Args:
+            offset: Buffer offset to read from
+            size: Number of bytes to peek
+
+        Returns:
+            bytes: Up to size bytes (fewer if the socket had no more data)
+        """
+        await self.fill(offset + size)
+        return self._copy_out(offset, size)
+
+    def _copy_out(self, offset: int, size: int) -> bytes:
+        """Copy size bytes at offset into a new bytes object in one step."""
+        with memoryview(self._buff) as view:
+            return view[offset:offset + size].tobytes()
 
     async def read(self, size: int) -> bytes:
         """
@@ -147,6 +209,18 @@ class SocketBuffer:
         del self._buff[:size]
         return read_str
 
+    def discard(self, size: int) -> None:
+        """
+        Drop size bytes from the front of the buffer.
+
+        Args:
+            size: Number of bytes to drop
+        """
+        del self._buff[:size]
+
+    def __len__(self) -> int:
+        return len(self._buff)
+
 
 class VcuTestInterface:
     """
@@ -190,9 +264,8 @@ class VcuTestInterface:
         if not await self.connect():
             raise VcuConnectFailed("Failed to establish connection with VCU")
 
-        # Step 2: Initialize test socket
-        self.test_sock = get_udp_sock()
-        self.test_sock.settimeout(0.1)
+        # Step 2: Initialize test socket, bound to the VCU test endpoint
+        self.test_sock = connect_udp_sock(get_udp_sock(), TEST_ENDPOINT)
 
         # Step 3: Send initial test request
         # Note: In full implementation, this would create a get_fw_version_req
@@ -212,8 +285,7 @@ class VcuTestInterface:
         Returns:
             bool: True if connected, False otherwise
         """
-        self.connect_sock = get_udp_sock()
-        self.connect_sock.settimeout(0.1)
+        self.connect_sock = connect_udp_sock(get_udp_sock(), CONNECT_ENDPOINT)
 
         connect_msg = b'connect'
 
@@ -223,10 +295,10 @@ class VcuTestInterface:
                 flush_udp_recv(self.connect_sock)
 
                 # Send connect message
-                self.connect_sock.sendto(connect_msg, CONNECT_ENDPOINT)
+                self.connect_sock.send(connect_msg)
 
                 if self.verbose:
-                    logger.debug(f"Sent: {connect_msg}")
+                    logger.debug("Sent: %s", connect_msg)
 
                 # Wait for echo
                 try:
@@ -237,19 +309,21 @@ class VcuTestInterface:
 
                     if connect_rsp == connect_msg:
                         if self.verbose:
-                            logger.debug(f"Received: {connect_rsp}")
+                            logger.debug("Received: %s", connect_rsp)
                         self._connected = True
                         logger.info("VCU connection established")
                         return True
 
-                except asyncio.TimeoutError:
+                except (asyncio.TimeoutError, ConnectionRefusedError):
+                    # Connected UDP socket: a VCU that is still booting answers
+                    # with ICMP port unreachable, surfaced as ConnectionRefusedError
                     pass
 
-                await asyncio.sleep(0.1)
-
             except Exception as e:
                 logger.warning(f"Connection attempt {i+1} failed: {e}")
 
+            await asyncio.sleep(0.1)
+
         return False
 
     async def poll(self, request: 'CommMsgBody', request_type: int = 1) -> 'CommMsgBody':
@@ -292,11 +366,11 @@ class VcuTestInterface:
                 )
 
         if self.verbose:
-            logger.debug(f"Protobuf Request: {request}")
+            logger.debug("Protobuf Request: %s", request)
 
         # Serialize and send
         request_str = request.SerializeToString()
-        await self._send_msg_body(self.test_sock, TEST_ENDPOINT, request_str)
+        await self._send_msg_body(self.test_sock, None, request_str)
 
         # Receive response
         resp_header, resp_header_str, response_str = await self._recv_frame(self.test_sock)
@@ -307,14 +381,14 @@ class VcuTestInterface:
         response = self._create_mock_response()
 
         if self.verbose:
-            logger.debug(f"Protobuf Response: {response}")
+            logger.debug("Protobuf Response: %s", response)
 
         return response
 
     async def _send_msg_body(
         self,
         sock: socket.socket,
-        endpoint: Tuple[str, int],
+        endpoint: Optional[Tuple[str, int]],
         msg_body: bytes
     ) -> None:
         """
@@ -322,34 +396,27 @@ class VcuTestInterface:
 
         Args:
             sock: Socket to send on
-            endpoint: (host, port) endpoint
+            endpoint: (host, port) endpoint, or None if sock is connected
             msg_body: Message body to send
         """
-        # Create header
-        import struct
-        from .header import create_header
-
-        header = create_header(msg_body, message_format=1)
-
-        # Serialize header
-        header_str = header.serialize()
-
-        # Send header + body
-        full_msg = header_str + msg_body
-        sock.sendto(full_msg, endpoint)
+        # Send header + body as one datagram
+        sent = send_framed(sock, msg_body, endpoint)
 
         if self.verbose:
-            logger.debug(f"Sent {len(full_msg)} bytes to {endpoint}")
+            logger.debug("Sent %d bytes to %s", sent, endpoint or sock.getpeername())
 
     async def _recv_frame(self, sock: socket.SocketType, timeout: float = DEFAULT_TIMEOUT) -> Tuple:
         """
         Receive frame with triple-frame detection.
 
         Implements 3-layer detection:
-        1. Sync based framing (0xCAFE)
+        1. Sync based framing (0xCAFE), located with a buffer-wide find
         2. Length based framing (valid range)
         3. CRC based framing (checksum validation)
 
+        A candidate that fails length or CRC is skipped by one byte and the
+        search resumes at the next sync word.
+
         Args:
             sock: Socket to receive from
             timeout: Receive timeout in seconds
@@ -362,7 +429,6 @@ class VcuTestInterface:
             VcuPollFailed: If frame validation fails
         """
         sock_buffer = SocketBuffer(sock)
-        frame_detector = deque(b'\xff' * 12, maxlen=12)  # Header size
         frame_header = CommMsgHeader_t()
 
         start_time = time.time()
@@ -372,35 +438,41 @@ class VcuTestInterface:
             if time.time() - start_time > timeout:
                 raise VcuTimeout(f"Frame detection timeout after {timeout}s")
 
-            # Read one byte
-            input_byte = await sock_buffer.read(1)
-            frame_detector.append(input_byte)
-            frame_header_str = bytes(frame_detector)
+            # 1. Sync based framing
+            pos = await sock_buffer.find(SYNC_BYTES)
+            if pos < 0:
+                # Keep a possible first sync byte at the end
+                sock_buffer.discard(len(sock_buffer) - (len(SYNC_BYTES) - 1))
+                continue
+            if pos:
+                sock_buffer.discard(pos)
+
+            frame_header_str = await sock_buffer.peek(HEADER_SIZE)
+            if len(frame_header_str) < HEADER_SIZE:
+                continue  # Header still arriving
+            frame_header.deserialize(frame_header_str)
+
+            # 2. Length based framing
+            if not frame_header.is_valid_length():
+                sock_buffer.discard(1)
+                continue
+
+            # Peek ahead to read body
+            msg_body_candidate_str = await sock_buffer.peek_at(HEADER_SIZE, frame_header.length)
+            if len(msg_body_candidate_str) < frame_header.length:
+                continue  # Body still arriving
+
+            # 3. CRC based framing
+            recv_crc = calculate_crc(frame_header_str, msg_body_candidate_str)
+            if recv_crc != frame_header.crc:
+                if self.verbose:
+                    logger.warning(f"CRC mismatch: expected {frame_header.crc}, got {recv_crc}")
+                sock_buffer.discard(1)
+                continue
 
-            try:
-                frame_header.deserialize(frame_header_str)
-
-                # 1. Sync based framing
-                if frame_header.sync == MAGIC_SYNC_U16:
-                    # 2. Length based framing
-                    if frame_header.is_valid_length():
-                        # Peek ahead to read body
-                        msg_body_candidate_str = await sock_buffer.peek(frame_header.length)
-
-                        # 3. CRC based framing
-                        recv_crc = calculate_crc(frame_header_str, msg_body_candidate_str)
-
-                        if recv_crc == frame_header.crc:
-                            # Valid frame - consume body
-                            await sock_buffer.read(frame_header.length)
-                            return frame_header, frame_header_str, msg_body_candidate_str
-                        else:
-                            if self.verbose:
-                                logger.warning(f"CRC mismatch: expected {frame_header.crc}, got {recv_crc}")
-
-            except Exception:
-                # Continue looking for valid frame
-                pass
+            # Valid frame - consume header and body
+            sock_buffer.discard(HEADER_SIZE + frame_header.length)
+            return frame_header, frame_header_str, msg_body_candidate_str
 
     async def _async_recvfrom(self, sock: socket.socket, bufsize: int) -> bytes:
         """
@@ -413,7 +485,7 @@ class VcuTestInterface:
         Returns:
             bytes: Received data
         """
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         return await asyncio.wait_for(
             loop.sock_recv(sock, bufsize),
             timeout=0.1
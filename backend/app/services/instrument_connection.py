@@ -8,6 +8,7 @@ import asyncio
 import logging
 from contextlib import asynccontextmanager
 
+from app.config import settings as app_settings
 from app.core.instrument_config import (
     InstrumentConfig,
     VISAAddress,
@@ -328,15 +329,22 @@ class SerialInstrumentConnection(BaseInstrumentConnection):
 class SimulationInstrumentConnection(BaseInstrumentConnection):
     """
     Simulated instrument connection for testing without hardware
+
+    Args:
+        config: Instrument configuration
+        simulate_delay: Seconds to wait in connect() to mimic hardware
+            (default 0; the factory passes settings.INSTRUMENT_SIMULATION_DELAY)
     """
 
-    def __init__(self, config: InstrumentConfig):
+    def __init__(self, config: InstrumentConfig, simulate_delay: float = 0.0):
         super().__init__(config)
         self._command_history: list[str] = []
+        self._sim_delay = simulate_delay
 
     async def connect(self) -> bool:
         """Simulate connection"""
-        await asyncio.sleep(0.1)  # Simulate connection delay
+        if self._sim_delay:
+            await asyncio.sleep(self._sim_delay)  # Simulate connection delay
         self.is_connected = True
         self.logger.info(f"[SIMULATION] Connected to {self.config.id}")
         return True
@@ -382,6 +390,9 @@ def create_instrument_connection(config: InstrumentConfig, simulation: bool = Fa
     """
     Factory function to create appropriate connection type
 
+    Simulated connections use settings.INSTRUMENT_SIMULATION_DELAY as their
+    connect delay.
+
     Args:
         config: Instrument configuration
         simulation: Force simulation mode (for testing)
@@ -390,7 +401,7 @@ def create_instrument_connection(config: InstrumentConfig, simulation: bool = Fa
         Appropriate instrument connection instance
     """
     if simulation or not config.enabled:
-        return SimulationInstrumentConnection(config)
+        return SimulationInstrumentConnection(config, app_settings.INSTRUMENT_SIMULATION_DELAY)
 
     conn_type = config.connection.type
 
@@ -400,7 +411,7 @@ def create_instrument_connection(config: InstrumentConfig, simulation: bool = Fa
         return VISAInstrumentConnection(config)
     else:
         logger.warning(f"Unknown connection type {conn_type}, using simulation")
-        return SimulationInstrumentConnection(config)
+        return SimulationInstrumentConnection(config, app_settings.INSTRUMENT_SIMULATION_DELAY)
 
 
 # ============================================================================
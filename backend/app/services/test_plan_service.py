@@ -3,7 +3,7 @@ Test Plan Service
 基於 PDTool4 test_point_map.py 和 test_point_runAllTest.py 的設計模式
 實作測試計畫管理器，提供 TestPointMap 風格的測試計畫操作
 """
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, Iterable, List, Optional, Any, Tuple
 # from sqlalchemy.orm import Session
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, distinct
@@ -743,6 +743,101 @@ class TestPlanService:
             self.logger.error(f"Failed to create test plan: {e}")
             raise
 
+    async def bulk_create_test_plans(
+        self,
+        db: AsyncSession,
+        test_plan_dicts: Iterable[Dict[str, Any]],
+        project_id: int,
+        station_id: int,
+        test_plan_name: Optional[str] = None,
+        batch_size: int = 1000
+    ) -> Tuple[int, int, List[str]]:
+        """
+        批次建立測試計畫項目 (CSV 匯入用)
+
+        Consumes test_plan_dicts lazily and flushes every batch_size items, so
+        only one batch of ORM objects is held in memory at a time. Existing
+        item_no values are loaded with a single query instead of one per item.
+        A batch that fails to flush is retried row by row, so a bad row is
+        reported in errors and skipped instead of aborting the whole upload.
+        The caller is responsible for commit/rollback.
+
+        Returns:
+            (total_items, created_items, errors)
+        """
+        result = await db.execute(
+            select(TestPlan.item_no).where(
+                TestPlan.project_id == project_id
+            ).where(
+                TestPlan.station_id == station_id
+            )
+        )
+        existing_item_nos = set(result.scalars().all())
+
+        total_items = 0
+        created_items = 0
+        errors: List[str] = []
+        batch: List[Dict[str, Any]] = []
+
+        for plan_dict in test_plan_dicts:
+            total_items += 1
+            item_no = plan_dict['item_no']
+            if item_no in existing_item_nos:
+                errors.append(
+                    f"Error creating item {plan_dict.get('item_name')}: "
+                    f"Test plan item with item_no={item_no} already exists"
+                )
+                continue
+            existing_item_nos.add(item_no)
+
+            batch.append({
+                **plan_dict,
+                'project_id': project_id,
+                'station_id': station_id,
+                'test_plan_name': test_plan_name
+            })
+            if len(batch) >= batch_size:
+                created_items += await self._flush_test_plan_batch(db, batch, errors)
+                batch.clear()
+
+        if batch:
+            created_items += await self._flush_test_plan_batch(db, batch, errors)
+
+        self.logger.info(f"Bulk created {created_items}/{total_items} test plan items")
+        return total_items, created_items, errors
+
+    async def _flush_test_plan_batch(
+        self,
+        db: AsyncSession,
+        batch: List[Dict[str, Any]],
+        errors: List[str]
+    ) -> int:
+        """
+        Insert one batch inside a savepoint; on failure retry it row by row.
+
+        Fresh TestPlan objects are built for the retry because a rolled-back
+        flush can leave generated primary keys on the original instances.
+
+        Returns:
+            Number of rows inserted
+        """
+        try:
+            async with db.begin_nested():
+                db.add_all([TestPlan(**data) for data in batch])
+            return len(batch)
+        except Exception as e:
+            self.logger.warning(f"Batch insert failed, retrying row by row: {e}")
+
+        created = 0
+        for data in batch:
+            try:
+                async with db.begin_nested():
+                    db.add(TestPlan(**data))
+                created += 1
+            except Exception as e:
+                errors.append(f"Error creating item {data.get('item_name')}: {str(e)}")
+        return created
+
     async def update_test_plan(
         self,
         db: AsyncSession,
@@ -4,9 +4,9 @@ Parses test plan CSV files from PDTool4 format
 """
 import csv
 import io
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional
 from pathlib import Path
-from app.schemas.testplan import TestPlanCSVRow
+from app.schemas.testplan import TestPlanCSVRow, CSV_ROW_ADAPTER
 
 
 class CSVParseError(Exception):
@@ -27,19 +27,23 @@ class TestPlanCSVParser:
     ]
 
     @staticmethod
-    def parse_csv_file(file_content: bytes, encoding: str = 'utf-8') -> List[TestPlanCSVRow]:
+    def iter_csv_rows(file_content: bytes, encoding: str = 'utf-8') -> Iterator[TestPlanCSVRow]:
         """
-        Parse CSV file content into TestPlanCSVRow objects
+        Lazily parse CSV file content, yielding one TestPlanCSVRow at a time
+
+        Only the row currently being processed is held as a Python object,
+        so callers can stream rows into the database without building the
+        whole list first.
 
         Args:
             file_content: Raw bytes content of the CSV file
             encoding: File encoding (default: utf-8)
 
-        Returns:
-            List of TestPlanCSVRow objects
+        Yields:
+            TestPlanCSVRow objects in file order
 
         Raises:
-            CSVParseError: If parsing fails
+            CSVParseError: If parsing fails (raised while iterating)
         """
         try:
             # Decode bytes to string
@@ -53,24 +57,23 @@ class TestPlanCSVParser:
                 raise CSVParseError("CSV file is empty or has no headers")
 
             # Parse rows
-            rows = []
+            row_count = 0
             for line_num, row in enumerate(csv_reader, start=2):  # Start at 2 (header is line 1)
                 try:
                     # Filter out non-string keys (None, integers) that can occur with malformed CSVs
                     # This prevents "keywords must be strings" error when unpacking with **
                     filtered_row = {k: v for k, v in row.items() if isinstance(k, str) and k.strip()}
 
-                    # Create TestPlanCSVRow object
-                    csv_row = TestPlanCSVRow(**filtered_row)
-                    rows.append(csv_row)
+                    # Create TestPlanCSVRow object via the shared adapter
+                    csv_row = CSV_ROW_ADAPTER.validate_python(filtered_row)
                 except Exception as e:
                     raise CSVParseError(f"Error parsing line {line_num}: {str(e)}")
+                row_count += 1
+                yield csv_row
 
-            if not rows:
+            if not row_count:
                 raise CSVParseError("CSV file contains no test items")
 
-            return rows
-
         except UnicodeDecodeError as e:
             raise CSVParseError(f"File encoding error: {str(e)}. Try different encoding.")
         except Exception as e:
@@ -78,6 +81,23 @@ class TestPlanCSVParser:
                 raise
             raise CSVParseError(f"Unexpected error parsing CSV: {str(e)}")
 
+    @classmethod
+    def parse_csv_file(cls, file_content: bytes, encoding: str = 'utf-8') -> List[TestPlanCSVRow]:
+        """
+        Parse CSV file content into TestPlanCSVRow objects
+
+        Args:
+            file_content: Raw bytes content of the CSV file
+            encoding: File encoding (default: utf-8)
+
+        Returns:
+            List of TestPlanCSVRow objects
+
+        Raises:
+            CSVParseError: If parsing fails
+        """
+        return list(cls.iter_csv_rows(file_content, encoding))
+
     @staticmethod
     def csv_row_to_testplan_dict(csv_row: TestPlanCSVRow, sequence_order: int) -> Dict[str, Any]:
         """
@@ -168,6 +188,28 @@ class TestPlanCSVParser:
             'wait_msec': wait_msec,
         }
 
+    @classmethod
+    def iter_testplan_dicts(
+        cls,
+        file_content: bytes,
+        encoding: str = 'utf-8'
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily parse CSV file and yield test plan dictionaries
+
+        Args:
+            file_content: Raw bytes content of the CSV file
+            encoding: File encoding (default: utf-8)
+
+        Yields:
+            Test plan dictionaries ready for database insertion
+
+        Raises:
+            CSVParseError: If parsing fails (raised while iterating)
+        """
+        for idx, csv_row in enumerate(cls.iter_csv_rows(file_content, encoding), start=1):
+            yield cls.csv_row_to_testplan_dict(csv_row, sequence_order=idx)
+
     @classmethod
     def parse_and_convert(
         cls,
@@ -184,11 +226,4 @@ class TestPlanCSVParser:
         Returns:
             List of test plan dictionaries ready for database insertion
         """
-        csv_rows = cls.parse_csv_file(file_content, encoding)
-
-        test_plans = []
-        for idx, csv_row in enumerate(csv_rows, start=1):
-            test_plan_dict = cls.csv_row_to_testplan_dict(csv_row, sequence_order=idx)
-            test_plans.append(test_plan_dict)
-
-        return test_plans
+        return list(cls.iter_testplan_dicts(file_content, encoding))